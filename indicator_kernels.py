@@ -0,0 +1,279 @@
+"""
+Compiled Technical Indicator Kernels
+Numba-jitted indicator recurrences and price statistics operating on float64 arrays
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional - kernels fall back to plain Python
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True, fastmath=True)
+def ema(values, period):
+    """Exponential moving average seeded with the SMA of the first window (TA-Lib convention)"""
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    out[:] = np.nan
+    if n < period:
+        return out
+
+    alpha = 2.0 / (period + 1)
+    prev = 0.0
+    for i in range(period):
+        prev += values[i]
+    prev /= period
+    out[period - 1] = prev
+
+    for i in range(period, n):
+        prev = alpha * values[i] + (1.0 - alpha) * prev
+        out[i] = prev
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def moving_averages(close, volume):
+    """EMA 9/21, SMA 20/50, Bollinger Bands (20, 2) and volume SMA 10 in a single pass over the data"""
+    n = close.shape[0]
+    ema_9 = np.full(n, np.nan)
+    ema_21 = np.full(n, np.nan)
+    sma_20 = np.full(n, np.nan)
+    sma_50 = np.full(n, np.nan)
+    bb_upper = np.full(n, np.nan)
+    bb_lower = np.full(n, np.nan)
+    volume_sma_10 = np.full(n, np.nan)
+
+    alpha_9 = 2.0 / 10.0
+    alpha_21 = 2.0 / 22.0
+    ema_9_prev = 0.0
+    ema_21_prev = 0.0
+    mean_20 = 0.0
+    m2_20 = 0.0
+    sum_50 = 0.0
+    volume_sum_10 = 0.0
+
+    for i in range(n):
+        price = close[i]
+
+        # EMAs are seeded with the SMA of their first window, like TA-Lib
+        if i < 9:
+            ema_9_prev += price
+            if i == 8:
+                ema_9_prev /= 9.0
+                ema_9[i] = ema_9_prev
+        else:
+            ema_9_prev = alpha_9 * price + (1.0 - alpha_9) * ema_9_prev
+            ema_9[i] = ema_9_prev
+
+        if i < 21:
+            ema_21_prev += price
+            if i == 20:
+                ema_21_prev /= 21.0
+                ema_21[i] = ema_21_prev
+        else:
+            ema_21_prev = alpha_21 * price + (1.0 - alpha_21) * ema_21_prev
+            ema_21[i] = ema_21_prev
+
+        # Welford-style running mean and sum of squared deviations, updated as the window slides.
+        # sum_sq / n - mean^2 cancels catastrophically at index price levels (20000 +- 1)
+        if i < 20:
+            delta = price - mean_20
+            mean_20 += delta / (i + 1)
+            m2_20 += delta * (price - mean_20)
+        else:
+            old = close[i - 20]
+            next_mean = mean_20 + (price - old) / 20.0
+            m2_20 += (price - old) * (price - next_mean + old - mean_20)
+            mean_20 = next_mean
+        if i >= 19:
+            variance = m2_20 / 20.0
+            deviation = np.sqrt(variance) if variance > 0.0 else 0.0
+            sma_20[i] = mean_20
+            bb_upper[i] = mean_20 + 2.0 * deviation
+            bb_lower[i] = mean_20 - 2.0 * deviation
+
+        sum_50 += price
+        if i >= 50:
+            sum_50 -= close[i - 50]
+        if i >= 49:
+            sma_50[i] = sum_50 / 50.0
+
+        volume_sum_10 += volume[i]
+        if i >= 10:
+            volume_sum_10 -= volume[i - 10]
+        if i >= 9:
+            volume_sma_10[i] = volume_sum_10 / 10.0
+
+    return ema_9, ema_21, sma_20, sma_50, bb_upper, bb_lower, volume_sma_10
+
+
+@njit(cache=True, fastmath=True)
+def macd(values, fast_period, slow_period, signal_period):
+    """MACD line, signal line and histogram from two EMAs and an EMA of their difference"""
+    n = values.shape[0]
+    macd_line = np.empty(n, dtype=np.float64)
+    signal = np.empty(n, dtype=np.float64)
+    hist = np.empty(n, dtype=np.float64)
+    macd_line[:] = np.nan
+    signal[:] = np.nan
+    hist[:] = np.nan
+
+    start = slow_period - 1
+    first_output = start + signal_period - 1
+    if n <= first_output:
+        return macd_line, signal, hist
+
+    # TA-Lib seeds the fast EMA at slow_period - fast_period rather than bar 0, so both EMAs
+    # produce their first value on the same bar (start)
+    fast = ema(values[slow_period - fast_period:], fast_period)
+    slow = ema(values, slow_period)
+    diff = fast[fast_period - 1:] - slow[start:]
+    signal_tail = ema(diff, signal_period)
+
+    # All three series start once the signal line is defined, as in talib.MACD
+    for i in range(first_output, n):
+        macd_line[i] = diff[i - start]
+        signal[i] = signal_tail[i - start]
+        hist[i] = macd_line[i] - signal[i]
+    return macd_line, signal, hist
+
+
+@njit(cache=True, fastmath=True)
+def rsi(values, period):
+    """Relative Strength Index using Wilder's smoothing of average gains and losses"""
+    n = values.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    out[:] = np.nan
+    if n <= period:
+        return out
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        change = values[i] - values[i - 1]
+        if change > 0:
+            avg_gain += change
+        else:
+            avg_loss -= change
+    avg_gain /= period
+    avg_loss /= period
+
+    total = avg_gain + avg_loss
+    out[period] = 100.0 * avg_gain / total if total != 0 else 0.0
+
+    for i in range(period + 1, n):
+        change = values[i] - values[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+        total = avg_gain + avg_loss
+        out[i] = 100.0 * avg_gain / total if total != 0 else 0.0
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def rolling_extrema(high, low, period):
+    """Highest high and lowest low over a trailing window using monotonic index deques - O(n) overall"""
+    n = high.shape[0]
+    highest = np.full(n, np.nan)
+    lowest = np.full(n, np.nan)
+    max_queue = np.empty(n, dtype=np.int64)
+    min_queue = np.empty(n, dtype=np.int64)
+    max_head = max_tail = 0
+    min_head = min_tail = 0
+
+    for i in range(n):
+        # Drop indexes that fell out of the window, then those dominated by the new value
+        if max_tail > max_head and max_queue[max_head] <= i - period:
+            max_head += 1
+        if min_tail > min_head and min_queue[min_head] <= i - period:
+            min_head += 1
+        while max_tail > max_head and high[max_queue[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        while min_tail > min_head and low[min_queue[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        max_queue[max_tail] = i
+        max_tail += 1
+        min_queue[min_tail] = i
+        min_tail += 1
+
+        if i >= period - 1:
+            highest[i] = high[max_queue[max_head]]
+            lowest[i] = low[min_queue[min_head]]
+    return highest, lowest
+
+
+@njit(cache=True, fastmath=True)
+def range_oscillators(high, low, close):
+    """ATR 14, Stochastic (5, 3, 3) and Williams %R 14 with TA-Lib's seeding and lookbacks"""
+    n = close.shape[0]
+    atr_14 = np.full(n, np.nan)
+    stoch_k = np.full(n, np.nan)
+    stoch_d = np.full(n, np.nan)
+    williams_r = np.full(n, np.nan)
+
+    highest_5, lowest_5 = rolling_extrema(high, low, 5)
+    highest_14, lowest_14 = rolling_extrema(high, low, 14)
+    fast_k = np.full(n, np.nan)
+
+    true_range_sum = 0.0
+    atr_prev = 0.0
+    for i in range(n):
+        # ATR: true range from the second bar, seeded with the mean of the first 14, then Wilder smoothing
+        if i >= 1:
+            true_range = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+            if i <= 14:
+                true_range_sum += true_range
+                if i == 14:
+                    atr_prev = true_range_sum / 14.0
+                    atr_14[i] = atr_prev
+            else:
+                atr_prev = (atr_prev * 13.0 + true_range) / 14.0
+                atr_14[i] = atr_prev
+
+        if i >= 4:
+            spread = highest_5[i] - lowest_5[i]
+            fast_k[i] = (close[i] - lowest_5[i]) / spread * 100.0 if spread != 0.0 else 0.0
+        # Slow %K is a 3-bar SMA of fast %K, slow %D a 3-bar SMA of slow %K - both start at TA-Lib's lookback of 8
+        if i >= 6:
+            stoch_k[i] = (fast_k[i] + fast_k[i - 1] + fast_k[i - 2]) / 3.0
+        if i >= 8:
+            stoch_d[i] = (stoch_k[i] + stoch_k[i - 1] + stoch_k[i - 2]) / 3.0
+
+        if i >= 13:
+            spread = highest_14[i] - lowest_14[i]
+            williams_r[i] = (highest_14[i] - close[i]) / spread * -100.0 if spread != 0.0 else 0.0
+
+    stoch_k[:8] = np.nan
+    return atr_14, stoch_k, stoch_d, williams_r
+
+
+@njit(cache=True)
+def price_stats(closes, current, prev_close):
+    """Trend direction (1 up, -1 down, 0 no history), close range and percent change vs previous close"""
+    change_percent = 0.0 if prev_close == 0 else (current - prev_close) / prev_close * 100.0
+    if closes.shape[0] == 0:
+        return 0, 0.0, change_percent
+
+    trend = 1 if closes[-1] > closes[0] else -1
+    return trend, closes.max() - closes.min(), change_percent
+
+
+def warm_up():
+    """Compile every kernel on a small dummy series so the first tool call doesn't pay JIT latency"""
+    prices = np.linspace(100.0, 110.0, 64)
+    moving_averages(prices, prices)
+    macd(prices, 12, 26, 9)
+    rsi(prices, 14)
+    range_oscillators(prices + 1.0, prices - 1.0, prices)
+    price_stats(prices[-5:], 110.0, 109.0)
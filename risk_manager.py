@@ -10,18 +10,14 @@ from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
-from trading_config import config
+from trading_config import config, setup_logging
 
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(config.log_file),
-        logging.StreamHandler()
-    ]
-)
+setup_logging()
 logger = logging.getLogger(__name__)
 
+# Markers that every F&O tradingsymbol carries (futures end in FUT, options in CE/PE)
+_DERIVATIVE_TOKENS = ('FUT', 'CE', 'PE')
+
 @dataclass
 class TradeRecord:
     """Record of a trade for tracking and analytics"""
@@ -145,9 +141,9 @@ class RiskManager:
             return True
         return False
     
-    def get_risk_status(self) -> Dict:
-        """Get current risk status and metrics"""
-        return {
+    def get_risk_status(self, include_history: bool = False, history_limit: int = 5) -> Dict:
+        """Get current risk status and metrics, optionally with the most recent trades"""
+        status = {
             "daily_pnl": self.daily_pnl,
             "daily_trades": self.daily_trades,
             "circuit_breaker_active": self.circuit_breaker_triggered,
@@ -158,6 +154,9 @@ class RiskManager:
             "remaining_loss_buffer": config.risk_limits.max_daily_loss + self.daily_pnl,
             "remaining_trade_buffer": config.risk_limits.max_daily_trades - self.daily_trades
         }
+        if include_history:
+            status["recent_trades"] = self.trade_history[-history_limit:]
+        return status
     
     def _check_market_hours(self) -> bool:
         """Check if market is open for trading"""
@@ -219,7 +218,7 @@ class RiskManager:
         """Additional validations for F&O orders"""
         symbol = order_params.get('tradingsymbol', '')
         
-        if not any(x in symbol for x in ['FUT', 'CE', 'PE']):
+        if not any(token in symbol for token in _DERIVATIVE_TOKENS):
             logger.warning(f"Invalid F&O symbol format: {symbol}")
             return False
         
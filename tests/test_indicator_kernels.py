@@ -0,0 +1,132 @@
+"""
+Regression checks for the compiled indicator kernels
+Expected values were recorded from TA-Lib 0.8.1, the library these kernels replace
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import indicator_kernels as kernels
+
+
+def sample_close(n=60):
+    """Deterministic trending, oscillating price series"""
+    i = np.arange(n, dtype=np.float64)
+    return 100.0 + 5.0 * np.sin(i * 0.3) + 0.2 * i
+
+
+def sample_bars(n=60):
+    """High, low and close bars around sample_close with uneven ranges"""
+    close = sample_close(n)
+    i = np.arange(n, dtype=np.float64)
+    return close + 1.0 + 0.5 * np.abs(np.cos(i * 0.7)), close - 1.0 - 0.5 * np.abs(np.sin(i * 0.5)), close
+
+
+def test_macd_matches_talib():
+    """MACD(12, 26, 9) - values from talib.MACD, including the first defined bar"""
+    macd_line, signal, hist = kernels.macd(sample_close(), 12, 26, 9)
+
+    assert np.isnan(macd_line[:33]).all()
+    assert np.isnan(signal[:33]).all()
+    assert np.isnan(hist[:33]).all()
+
+    expected = {
+        33: (0.9117950060373232, 0.927439274519696, -0.01564426848237277),
+        34: (0.6245639007152874, 0.8668641997588142, -0.2423002990435268),
+        45: (1.572528918630681, 0.7085037534851619, 0.8640251651455191),
+        59: (0.12518409238295192, 0.9407900595291107, -0.8156059671461587),
+    }
+    for index, values in expected.items():
+        assert (macd_line[index], signal[index], hist[index]) == pytest.approx(values, rel=1e-9, abs=1e-12)
+
+
+def test_bollinger_bands_match_talib():
+    """BBANDS(20, 2, 2) upper and lower bands - values from talib.BBANDS"""
+    close = sample_close()
+    _, _, sma_20, _, bb_upper, bb_lower, _ = kernels.moving_averages(close, close)
+
+    assert np.isnan(bb_upper[:19]).all()
+    expected = {
+        19: (107.50838050387627, 96.42735760642826),
+        40: (111.69682895960783, 100.63128609225767),
+        59: (116.13693875922974, 104.02026257609836),
+    }
+    for index, values in expected.items():
+        assert (bb_upper[index], bb_lower[index]) == pytest.approx(values, rel=1e-12)
+    assert sma_20[59] == pytest.approx(close[40:60].mean(), rel=1e-12)
+
+
+def test_bollinger_deviation_is_precise_at_index_levels():
+    """Band width must not lose precision to cancellation when prices sit near 20000"""
+    close = 20000.0 + np.random.default_rng(1).uniform(-1.0, 1.0, 500)
+    _, _, sma_20, _, bb_upper, _, _ = kernels.moving_averages(close, close)
+
+    expected = np.array([close[i - 19:i + 1].std() for i in range(19, 500)])
+    assert np.allclose((bb_upper[19:] - sma_20[19:]) / 2.0, expected, rtol=0.0, atol=1e-9)
+
+
+def test_rsi_matches_talib():
+    """RSI(14) - values from talib.RSI, including a series one bar past the warm-up"""
+    rsi = kernels.rsi(sample_close(), 14)
+
+    assert np.isnan(rsi[:14]).all()
+    expected = {14: 44.31279766538331, 15: 43.19283184195997, 40: 55.06086168157459, 59: 45.10159747655268}
+    for index, value in expected.items():
+        assert rsi[index] == pytest.approx(value, rel=1e-12)
+
+    short = kernels.rsi(sample_close(15), 14)
+    assert np.isnan(short[:14]).all()
+    assert short[14] == pytest.approx(44.31279766538331, rel=1e-12)
+
+
+def test_atr_matches_talib():
+    """ATR(14) - values from talib.ATR, including a series one bar past the warm-up"""
+    atr_14, _, _, _ = kernels.range_oscillators(*sample_bars())
+
+    assert np.isnan(atr_14[:14]).all()
+    expected = {14: 2.696587135663342, 30: 2.6970682847130134, 59: 2.687235180424469}
+    for index, value in expected.items():
+        assert atr_14[index] == pytest.approx(value, rel=1e-12)
+
+    short, _, _, _ = kernels.range_oscillators(*sample_bars(15))
+    assert np.isnan(short[:14]).all()
+    assert short[14] == pytest.approx(2.696587135663342, rel=1e-12)
+
+
+def test_stochastic_matches_talib():
+    """STOCH(5, 3, 3) slow %K and %D - values from talib.STOCH, including a series one bar past the warm-up"""
+    _, stoch_k, stoch_d, _ = kernels.range_oscillators(*sample_bars())
+
+    assert np.isnan(stoch_k[:8]).all()
+    assert np.isnan(stoch_d[:8]).all()
+    expected = {
+        8: (57.33789273853446, 69.26349968312148),
+        9: (42.08972492699174, 57.07060830861651),
+        30: (39.35383409596634, 54.808713401082144),
+        59: (34.58530077308669, 25.034519613075087),
+    }
+    for index, values in expected.items():
+        assert (stoch_k[index], stoch_d[index]) == pytest.approx(values, rel=1e-12)
+
+    _, short_k, short_d, _ = kernels.range_oscillators(*sample_bars(9))
+    assert np.isnan(short_k[:8]).all()
+    assert (short_k[8], short_d[8]) == pytest.approx((57.33789273853446, 69.26349968312148), rel=1e-12)
+
+
+def test_williams_r_matches_talib():
+    """WILLR(14) - values from talib.WILLR, including a series one bar past the warm-up"""
+    _, _, _, williams_r = kernels.range_oscillators(*sample_bars())
+
+    assert np.isnan(williams_r[:13]).all()
+    expected = {13: -88.22007112250729, 30: -25.653385690684605, 59: -81.44108570848721}
+    for index, value in expected.items():
+        assert williams_r[index] == pytest.approx(value, rel=1e-12)
+
+    _, _, _, short = kernels.range_oscillators(*sample_bars(14))
+    assert np.isnan(short[:13]).all()
+    assert short[13] == pytest.approx(-88.22007112250729, rel=1e-12)
@@ -4,6 +4,10 @@ Production-ready settings for live trading with safety controls
 """
 
 import os
+import atexit
+import logging
+import logging.handlers
+import queue
 from datetime import time, datetime
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
@@ -70,6 +74,16 @@ class TradingConfig:
     enable_pnl_tracking: bool = True
     enable_analytics: bool = True
     
+    http_pool_connections: int = 8  # Keep-alive connection pools for the Kite client
+    http_pool_maxsize: int = 16
+    http_max_retries: int = 2  # connection-level retries for dropped keep-alive sockets
+    kite_max_workers: int = 8  # Threads for concurrent blocking Kite API calls
+    instrument_cache_ttl: int = 3600  # seconds to reuse a downloaded instrument dump
+    history_cache_size: int = 256  # historical_data responses kept in memory
+    account_cache_ttl: float = 2.0  # seconds to reuse margins/positions between polls
+    quote_cache_ttl: float = 1.5  # seconds to reuse a quote across back-to-back tool calls
+    response_chunk_chars: int = 16384  # max characters per content block in large tool responses
+    
     def validate(self) -> List[str]:
         """Validate configuration and return any errors"""
         errors = []
@@ -120,3 +134,26 @@ if config_errors:
         print(f"  - {error}")
 else:
     print(f"✅ Trading configuration loaded - Environment: {config.environment}")
+
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def setup_logging() -> None:
+    """Route log records through a queue so file and console writes happen off the event loop thread"""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    log_queue = queue.SimpleQueue()
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handlers = [logging.FileHandler(config.log_file), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # flushes queued records on shutdown
+    
+    # Attached directly rather than through basicConfig, which would give the queue handler a default formatter
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, config.log_level))
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
@@ -4,20 +4,33 @@ Provides tools for fetching stock data, analyzing with sequential thinking,
 monitoring orders, and executing buy/sell trades.
 """
 
+import io
 import json
 import os
+import re
 import asyncio
+import functools
 import logging
+import threading
+import time
 import numpy as np
 import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, field
+from operator import itemgetter
 from dotenv import load_dotenv
-import talib
 
-from trading_config import config
+try:
+    import orjson
+except ImportError:  # orjson is optional - dump_json falls back to the stdlib encoder
+    orjson = None
+
+from trading_config import config, setup_logging
 from risk_manager import risk_manager
+import indicator_kernels as kernels
 
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
@@ -32,42 +45,327 @@ from mcp.types import (
 import mcp.types as types
 
 from kiteconnect import KiteConnect
+from urllib3.util.retry import Retry
 
 load_dotenv('config.env')
 
-logging.basicConfig(
-    level=getattr(logging, config.log_level),
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(config.log_file),
-        logging.StreamHandler()
-    ]
-)
+setup_logging()
 logger = logging.getLogger(__name__)
 
 kite = None
 
+# Display format for the timestamps in tool responses
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# KiteConnect is synchronous - blocking calls run here so the event loop stays responsive
+kite_executor = ThreadPoolExecutor(max_workers=config.kite_max_workers, thread_name_prefix="kite")
+_kite_lock = threading.Lock()
+
 def init_kite():
-    """Initialize Kite Connect instance with production configuration"""
+    """Initialize Kite Connect instance with production configuration - a no-op once a client exists"""
     global kite
     
+    # One client for the server lifetime, so every call shares its pooled keep-alive session
+    if kite is not None:
+        return kite
+    
     if not config.api_key or not config.access_token:
         raise ValueError("API credentials not configured properly")
     
-    kite = KiteConnect(api_key=config.api_key)
-    kite.set_access_token(config.access_token)
+    # Build and validate on a local so other threads never see a half-initialized client
+    client = KiteConnect(
+        api_key=config.api_key,
+        pool={
+            "pool_connections": config.http_pool_connections,
+            "pool_maxsize": config.http_pool_maxsize,
+            # urllib3 only re-sends idempotent methods on read errors, so orders are never duplicated
+            "max_retries": Retry(total=config.http_max_retries, backoff_factor=0.1)
+        }
+    )
+    client.set_access_token(config.access_token)
     
     logger.info(f"Kite Connect initialized - Environment: {config.environment}")
     
     try:
-        profile = kite.profile()
+        profile = client.profile()
         logger.info(f"Connected as: {profile.get('user_name')} ({profile.get('user_id')})")
     except Exception as e:
         logger.error(f"Connection validation failed: {e}")
         raise
     
+    if kernels.NUMBA_AVAILABLE:
+        # Load (or compile) the jitted kernels now rather than inside the first indicator request
+        started = time.perf_counter()
+        kernels.warm_up()
+        logger.info(f"Indicator kernels warmed up in {time.perf_counter() - started:.2f}s")
+    
+    kite = client
     return kite
 
+def get_kite() -> KiteConnect:
+    """Return the shared Kite client, initializing it once even when several threads race on a cold start"""
+    if kite is None:
+        with _kite_lock:
+            if kite is None:
+                init_kite()
+    return kite
+
+async def run_kite(fn, *args, **kwargs):
+    """Run a blocking Kite Connect call on the bounded kite executor"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(kite_executor, functools.partial(fn, *args, **kwargs))
+
+async def ensure_kite():
+    """Initialize the shared Kite client off the event loop if it isn't ready yet"""
+    if kite is None:
+        await run_kite(get_kite)
+
+_account_cache: Dict[str, Tuple[float, Any]] = {}
+
+def get_account_data(endpoint: str) -> Any:
+    """kite.margins() or kite.positions() behind a short TTL so rapid polling shares one response"""
+    cached = _account_cache.get(endpoint)
+    now = time.monotonic()
+    if cached and now - cached[0] < config.account_cache_ttl:
+        return cached[1]
+    data = getattr(kite, endpoint)()
+    _account_cache[endpoint] = (now, data)
+    return data
+
+_quote_cache: Dict[str, Tuple[float, Dict]] = {}
+_QUOTE_CACHE_PRUNE_SIZE = 1024
+
+def get_quotes(keys: List[str]) -> Dict[str, Dict]:
+    """kite.quote() for just the keys not quoted within the last few seconds - raises like kite.quote"""
+    now = time.monotonic()
+    quotes = {}
+    stale = []
+    for key in keys:
+        cached = _quote_cache.get(key)
+        if cached and now - cached[0] < config.quote_cache_ttl:
+            quotes[key] = cached[1]
+        else:
+            stale.append(key)
+    if not stale:
+        return quotes
+    
+    fetched = kite.quote(stale)
+    for key, quote in fetched.items():
+        _quote_cache[key] = (now, quote)
+    quotes.update(fetched)
+    
+    # Options chains quote dozens of contracts at a time - drop expired entries before the cache balloons
+    if len(_quote_cache) > _QUOTE_CACHE_PRUNE_SIZE:
+        for key, (quoted_at, _) in list(_quote_cache.items()):
+            if now - quoted_at >= config.quote_cache_ttl:
+                _quote_cache.pop(key, None)
+    return quotes
+
+def place_order(**order_params) -> str:
+    """kite.place_order that drops cached margins/positions and the traded quote once the order is accepted"""
+    order_id = kite.place_order(**order_params)
+    _account_cache.clear()
+    _quote_cache.pop(f"{order_params.get('exchange')}:{order_params.get('tradingsymbol')}", None)
+    return order_id
+
+async def fetch_quotes(keys: List[str]) -> Dict[str, Dict]:
+    """Quote many instruments in one request - Kite leaves invalid instruments out of the response, so a
+    batch only fails on token, network or rate-limit errors and those are raised to the caller"""
+    return await run_kite(get_quotes, keys)
+
+@dataclass
+class InstrumentTable:
+    """Cached instrument dump for one exchange - columnar frame plus row-position indexes"""
+    fetched_at: float
+    frame: pd.DataFrame
+    by_symbol: Dict[str, int]
+    by_name: Dict[str, int]
+    upper_symbols: pd.Series  # upper-cased once per fetch for substring fallbacks
+    upper_names: pd.Series
+    fno_matches: Dict[str, List[Dict]] = field(default_factory=dict)  # get_fno_instruments results per symbol
+    
+    def record(self, position: int) -> Dict:
+        """Materialize one row as a plain instrument dict"""
+        row = self.frame.iloc[position].to_dict()
+        return {key: value.item() if isinstance(value, np.generic) else value for key, value in row.items()}
+
+_instrument_cache: Dict[str, InstrumentTable] = {}
+_instrument_locks: Dict[str, threading.Lock] = {}
+_instrument_locks_guard = threading.Lock()
+
+_INSTRUMENT_CATEGORIES = ['name', 'instrument_type', 'segment', 'exchange', 'expiry']
+
+# Text columns must stay strings even when a value looks numeric or like "NA"
+_INSTRUMENT_CSV_OPTIONS = {
+    'dtype': {column: str for column in ['tradingsymbol', 'name', 'instrument_type', 'segment', 'exchange']},
+    'keep_default_na': False,
+    'na_values': [''],
+}
+
+def _fetch_instrument_frame(exchange: str) -> pd.DataFrame:
+    """Download an exchange's instrument CSV and parse it column-wise, falling back to the SDK's row parser"""
+    try:
+        response = kite.reqsession.get(
+            f"{kite.root}/instruments/{exchange}",
+            headers={
+                "X-Kite-Version": "3",
+                "Authorization": f"token {config.api_key}:{config.access_token}"
+            },
+            timeout=kite.timeout
+        )
+        response.raise_for_status()
+        body = io.BytesIO(response.content)
+        try:
+            return pd.read_csv(body, engine='pyarrow', **_INSTRUMENT_CSV_OPTIONS)
+        except ImportError:
+            body.seek(0)
+            return pd.read_csv(body, **_INSTRUMENT_CSV_OPTIONS)
+    except Exception as e:
+        logger.warning(f"Direct instrument download failed for {exchange}, using SDK parser: {e}")
+        return pd.DataFrame(kite.instruments(exchange))
+
+def _build_instrument_table(frame: pd.DataFrame) -> InstrumentTable:
+    """Compact an instrument dump into a columnar frame and index it by upper-cased tradingsymbol and name"""
+    frame = frame.reset_index(drop=True)
+    if 'expiry' in frame.columns:
+        # Normalize to YYYY-MM-DD strings so expiry filters can compare against user input
+        frame['expiry'] = pd.to_datetime(frame['expiry'], errors='coerce').dt.strftime('%Y-%m-%d').fillna('')
+    for column in _INSTRUMENT_CATEGORIES:
+        if column in frame.columns:
+            frame[column] = frame[column].fillna('').astype('category')
+    for column in ['instrument_token', 'exchange_token', 'lot_size']:
+        if column in frame.columns:
+            frame[column] = pd.to_numeric(frame[column], downcast='integer')
+    # Price columns (strike, tick_size, last_price) stay float64 - float32 turns a 7.35 strike into 7.349999904632568
+    if 'strike' in frame.columns:
+        frame['strike'] = pd.to_numeric(frame['strike']).astype(np.float64)
+    
+    by_symbol = {}
+    by_name = {}
+    upper_symbols = pd.Series(dtype=object)
+    upper_names = pd.Series(dtype=object)
+    if len(frame):
+        upper_symbols = frame['tradingsymbol'].str.upper()
+        upper_names = frame['name'].astype(str).str.upper()
+        for position, (symbol, name) in enumerate(zip(upper_symbols, upper_names)):
+            by_symbol.setdefault(symbol, position)
+            by_name.setdefault(name, position)
+    return InstrumentTable(time.time(), frame, by_symbol, by_name, upper_symbols, upper_names)
+
+def get_instrument_table(exchange: str) -> InstrumentTable:
+    """Get the indexed instrument dump for an exchange, refetching once the cache TTL expires"""
+    table = _instrument_cache.get(exchange)
+    if table and time.time() - table.fetched_at < config.instrument_cache_ttl:
+        return table
+    
+    with _instrument_locks_guard:
+        lock = _instrument_locks.setdefault(exchange, threading.Lock())
+    
+    # Concurrent misses wait for the first download instead of starting their own
+    with lock:
+        table = _instrument_cache.get(exchange)
+        if table and time.time() - table.fetched_at < config.instrument_cache_ttl:
+            return table
+        
+        table = _build_instrument_table(_fetch_instrument_frame(exchange))
+        _instrument_cache[exchange] = table
+        logger.info(f"Cached {len(table.frame)} {exchange} instruments")
+        return table
+
+def find_instrument(exchange: str, symbol: str, match_name: bool = False) -> Optional[Dict]:
+    """Resolve a symbol to an instrument - exact index hit first, substring scan on a miss"""
+    table = get_instrument_table(exchange)
+    key = symbol.upper()
+    
+    position = table.by_symbol.get(key)
+    if position is None and match_name:
+        position = table.by_name.get(key)
+    if position is not None:
+        return table.record(position)
+    
+    if not len(table.frame):
+        return None
+    mask = table.upper_symbols.str.contains(key, regex=False)
+    if match_name:
+        mask |= table.upper_names.str.contains(key, regex=False)
+    matches = np.flatnonzero(mask.to_numpy())
+    return table.record(int(matches[0])) if len(matches) else None
+
+# Seconds per candle - history requests are rounded down to a cache bucket so repeated queries share a slot
+_INTERVAL_SECONDS = {
+    'minute': 60, '3minute': 180, '5minute': 300, '10minute': 600,
+    '15minute': 900, '30minute': 1800, '60minute': 3600
+}
+# The latest candle is still forming, so no interval is served more than five minutes stale. A 300 s grid
+# from midnight also lands on the 09:15 open, so longer candles (which start at 09:15) are never cut off
+_HISTORY_BUCKET_CAP = 300
+
+def _quantize(moment: datetime, interval: str) -> datetime:
+    """Round a timestamp down to its cache bucket - the candle length, capped at _HISTORY_BUCKET_CAP"""
+    step = min(_INTERVAL_SECONDS.get(interval, _HISTORY_BUCKET_CAP), _HISTORY_BUCKET_CAP)
+    midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    elapsed = int((moment - midnight).total_seconds())
+    return midnight + timedelta(seconds=elapsed - elapsed % step)
+
+@functools.lru_cache(maxsize=config.history_cache_size)
+def _cached_history(instrument_token: int, from_date: datetime, to_date: datetime, interval: str) -> Tuple[Dict, ...]:
+    """Candles for an already-quantized range - tuples so shared cache entries can't be mutated in place"""
+    return tuple(kite.historical_data(
+        instrument_token=instrument_token,
+        from_date=from_date,
+        to_date=to_date,
+        interval=interval
+    ))
+
+def get_historical_data(instrument_token: int, from_date: datetime, to_date: datetime, interval: str) -> List[Dict]:
+    """Fetch candles through an LRU cache keyed on the interval-quantized date range"""
+    return list(_cached_history(
+        int(instrument_token), _quantize(from_date, interval), _quantize(to_date, interval), interval
+    ))
+
+_OHLCV_FIELDS = ['open', 'high', 'low', 'close', 'volume']
+_OHLCV_DTYPE = np.dtype([(column, np.float64) for column in _OHLCV_FIELDS])
+
+def to_ohlcv_array(candles: List[Dict]) -> np.ndarray:
+    """Pack Kite candle dicts into an OHLCV structured array - non-numeric or missing values become NaN"""
+    try:
+        return np.fromiter(
+            ((c['open'], c['high'], c['low'], c['close'], c['volume']) for c in candles),
+            dtype=_OHLCV_DTYPE,
+            count=len(candles)
+        )
+    except (KeyError, TypeError, ValueError):
+        # Malformed rows are rare - coerce instead of failing the whole request.
+        # One from_records pass replaces a Python list comprehension per column.
+        frame = pd.DataFrame.from_records(candles, columns=_OHLCV_FIELDS)
+        packed = np.empty(len(candles), dtype=_OHLCV_DTYPE)
+        for column in _OHLCV_FIELDS:
+            packed[column] = pd.to_numeric(frame[column], errors='coerce')
+        return packed
+
+def json_default(obj: Any) -> Any:
+    """json.dumps fallback - numpy arrays and scalars become lists/numbers, anything else a string"""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+def dump_json(obj: Any, indent: bool = True) -> str:
+    """Serialize a tool payload with orjson when installed, stdlib json otherwise"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=json_default, option=option).decode()
+    if indent:
+        return json.dumps(obj, indent=2, default=json_default)
+    return json.dumps(obj, separators=(',', ':'), default=json_default)
+
+async def dump_json_async(obj: Any, indent: bool = True) -> str:
+    """dump_json on a worker thread - large payloads would otherwise stall every other tool call"""
+    return await asyncio.to_thread(dump_json, obj, indent)
+
 @dataclass
 class ThinkingStep:
     """Represents a step in sequential thinking process"""
@@ -77,99 +375,264 @@ class ThinkingStep:
     conclusion: str
     next_action: Optional[str] = None
 
+@dataclass(slots=True)
+class OptionRow:
+    """Single strike row of an options chain"""
+    strike: float
+    premium: float
+    change: float
+    volume: int
+    oi: int
+    tradingsymbol: str
+
+def options_ndjson(call_options: List[OptionRow], put_options: List[OptionRow]) -> List[str]:
+    """One compact JSON line per option (NDJSON) instead of one pretty-printed blob"""
+    rows = [dump_json({'type': 'CE', **asdict(row)}, indent=False) for row in call_options]
+    rows.extend(dump_json({'type': 'PE', **asdict(row)}, indent=False) for row in put_options)
+    return rows
+
+def indicators_ndjson(summary: Dict, indicators: Dict) -> List[str]:
+    """Summary line first, then one compact JSON line per indicator series"""
+    rows = [dump_json(summary, indent=False)]
+    rows.extend(dump_json({name: values}, indent=False) for name, values in indicators.items())
+    return rows
+
+def fenced_chunks(lines: List[str], fence: str = "ndjson") -> List[types.TextContent]:
+    """Pack NDJSON lines into fenced blocks of about config.response_chunk_chars each, so clients
+    can render a large response progressively instead of parsing one giant string"""
+    blocks = []
+    current: List[str] = []
+    size = 0
+    for line in lines:
+        if current and size + len(line) > config.response_chunk_chars:
+            blocks.append(current)
+            current = []
+            size = 0
+        current.append(line)
+        size += len(line) + 1
+    if current:
+        blocks.append(current)
+    return [types.TextContent(type="text", text=f"```{fence}\n" + "\n".join(block) + "\n```") for block in blocks]
+
 class TechnicalIndicatorCalculator:
     """Pure technical indicator calculation without analysis - provides raw data for AI agents"""
     
-    def calculate_indicators(self, df: pd.DataFrame) -> Dict:
+    def calculate_indicators(self, close: np.ndarray, high: np.ndarray,
+                             low: np.ndarray, volume: np.ndarray, tail: int = 200) -> Dict:
         """Calculate raw technical indicators - no interpretation, just values"""
         indicators = {}
         
-        if len(df) == 0:
+        if len(close) == 0:
             return {"error": "No data provided"}
         
-        close = df['close'].values
-        high = df['high'].values  
-        low = df['low'].values
-        volume = df['volume'].values
+        # Structured-array fields are strided views - the kernels get one contiguous float64 copy each
+        close = np.ascontiguousarray(close, dtype=np.float64)
+        high = np.ascontiguousarray(high, dtype=np.float64)
+        low = np.ascontiguousarray(low, dtype=np.float64)
+        volume = np.ascontiguousarray(volume, dtype=np.float64)
+        
+        ema_9, ema_21, sma_20, sma_50, bb_upper, bb_lower, volume_sma_10 = kernels.moving_averages(close, volume)
         
-        indicators['ema_9'] = talib.EMA(close, timeperiod=9).tolist() if len(close) >= 9 else []
-        indicators['ema_21'] = talib.EMA(close, timeperiod=21).tolist() if len(close) >= 21 else []
-        indicators['sma_20'] = talib.SMA(close, timeperiod=20).tolist() if len(close) >= 20 else []
-        indicators['sma_50'] = talib.SMA(close, timeperiod=50).tolist() if len(close) >= 50 else []
+        indicators['ema_9'] = ema_9 if len(close) >= 9 else []
+        indicators['ema_21'] = ema_21 if len(close) >= 21 else []
+        indicators['sma_20'] = sma_20 if len(close) >= 20 else []
+        indicators['sma_50'] = sma_50 if len(close) >= 50 else []
         
-        indicators['rsi_14'] = talib.RSI(close, timeperiod=14).tolist() if len(close) >= 14 else []
+        indicators['rsi_14'] = kernels.rsi(close, 14) if len(close) >= 14 else []
         
         if len(close) >= 26:
-            macd, macd_signal, macd_hist = talib.MACD(close)
-            indicators['macd'] = macd.tolist()
-            indicators['macd_signal'] = macd_signal.tolist()
-            indicators['macd_histogram'] = macd_hist.tolist()
+            indicators['macd'], indicators['macd_signal'], indicators['macd_histogram'] = kernels.macd(close, 12, 26, 9)
         else:
             indicators['macd'] = []
             indicators['macd_signal'] = []
             indicators['macd_histogram'] = []
         
         if len(close) >= 20:
-            bb_upper, bb_middle, bb_lower = talib.BBANDS(close, timeperiod=20, nbdevup=2, nbdevdn=2)
-            indicators['bb_upper'] = bb_upper.tolist()
-            indicators['bb_middle'] = bb_middle.tolist()
-            indicators['bb_lower'] = bb_lower.tolist()
+            indicators['bb_upper'] = bb_upper
+            indicators['bb_middle'] = sma_20
+            indicators['bb_lower'] = bb_lower
         else:
             indicators['bb_upper'] = []
             indicators['bb_middle'] = []
             indicators['bb_lower'] = []
         
-        indicators['atr_14'] = talib.ATR(high, low, close, timeperiod=14).tolist() if len(close) >= 14 else []
+        atr_14, stoch_k, stoch_d, williams_r = kernels.range_oscillators(high, low, close)
         
-        if len(volume) >= 10:
-            indicators['volume_sma_10'] = talib.SMA(volume.astype(float), timeperiod=10).tolist()
-        else:
-            indicators['volume_sma_10'] = []
+        indicators['atr_14'] = atr_14 if len(close) >= 14 else []
+        indicators['volume_sma_10'] = volume_sma_10 if len(volume) >= 10 else []
         
-        indicators['stoch_k'], indicators['stoch_d'] = talib.STOCH(high, low, close) if len(close) >= 14 else ([], [])
-        indicators['williams_r'] = talib.WILLR(high, low, close, timeperiod=14).tolist() if len(close) >= 14 else []
+        indicators['stoch_k'], indicators['stoch_d'] = (stoch_k, stoch_d) if len(close) >= 14 else ([], [])
+        indicators['williams_r'] = williams_r if len(close) >= 14 else []
         
+        # Values stay as numpy arrays (tail slices are views); json_default converts them once at serialization
+        if tail > 0:
+            indicators = {name: values[-tail:] for name, values in indicators.items()}
         return indicators
 
+# F&O tradingsymbols end in FUT or strike + CE/PE (NIFTY24SEP24000CE); a bare suffix test would
+# also catch equities such as RELIANCE
+_FNO_TAIL = re.compile(r'(?:FUT|\dCE|\dPE)$')
+_OPTION_TAIL = re.compile(r'\d(?:CE|PE)$')
+
+def _exchange_for(tradingsymbol: str) -> str:
+    """NFO for futures and options tradingsymbols, NSE for everything else"""
+    return "NFO" if _FNO_TAIL.search(tradingsymbol) else "NSE"
+
+_SL_TYPES = frozenset({'SL', 'SL-M'})
+_PENDING_STATUSES = frozenset({'OPEN', 'TRIGGER PENDING'})
+_OPTION_TYPES = frozenset({'CE', 'PE'})
+_STATUS_ICONS = {'OPEN': "🟢", 'TRIGGER PENDING': "🟡"}  # anything else is shown as 🔴
+
+# Index underlyings are listed under several spellings across the NFO dump
+_FNO_SEARCH_ALIASES = {
+    "NIFTY": frozenset({"NIFTY", "NIFTY50", "NIFTY 50"}),
+    "BANKNIFTY": frozenset({"BANKNIFTY", "NIFTYBANK"}),
+}
+
 def get_fno_instruments(symbol: str) -> List[Dict]:
     """Get F&O instruments for a symbol"""
     try:
-        if not kite:
-            init_kite()
+        get_kite()
             
-        nfo_instruments = kite.instruments("NFO")
-        
-        fno_list = []
-        for inst in nfo_instruments:
-            search_terms = [symbol.upper()]
-            if symbol.upper() == "NIFTY":
-                search_terms.extend(["NIFTY50", "NIFTY 50"])
-            elif symbol.upper() == "BANKNIFTY":
-                search_terms.extend(["BANKNIFTY", "NIFTYBANK"])
-            
-            for term in search_terms:
-                if (term in inst['name'].upper() or 
-                    term in inst['tradingsymbol'].upper() or
-                    inst['tradingsymbol'].upper().startswith(term)):
-                    fno_list.append({
-                        'instrument_token': inst['instrument_token'],
-                        'tradingsymbol': inst['tradingsymbol'],
-                        'name': inst['name'],
-                        'expiry': inst['expiry'],
-                        'strike': inst['strike'],
-                        'instrument_type': inst['instrument_type'],  # FUT, CE, PE
-                        'lot_size': inst['lot_size'],
-                        'tick_size': inst['tick_size']
-                    })
-                    break
-        
-        return fno_list
+        table = get_instrument_table("NFO")
+        key = symbol.upper()
+        # Results live on the table, so they expire together with the instrument dump they came from
+        cached = table.fno_matches.get(key)
+        if cached is not None:
+            return list(cached)
+        
+        frame = table.frame
+        if not len(frame):
+            return []
+        
+        search_terms = _FNO_SEARCH_ALIASES.get(key, frozenset({key}))
+        
+        # Vectorized match over the columnar dump (contains also covers the old startswith test).
+        # Names are categorical, so they are matched once per distinct name rather than once per row.
+        name_categories = frame['name'].cat.categories
+        category_names = pd.Series(name_categories).str.upper()
+        symbols = table.upper_symbols
+        matched_names = np.zeros(len(name_categories), dtype=bool)
+        mask = np.zeros(len(frame), dtype=bool)
+        for term in search_terms:
+            matched_names |= category_names.str.contains(term, regex=False).to_numpy()
+            mask |= symbols.str.contains(term, regex=False).to_numpy()
+        mask |= frame['name'].isin(name_categories[matched_names]).to_numpy()
+        
+        columns = ['instrument_token', 'tradingsymbol', 'name', 'expiry', 'strike',
+                   'instrument_type', 'lot_size', 'tick_size']  # instrument_type: FUT, CE, PE
+        matches = frame.loc[mask, columns].to_dict('records')
+        table.fno_matches[key] = matches
+        return list(matches)
     except Exception as e:
         print(f"Error getting F&O instruments: {e}")
         return []
 
+def warm_instrument_cache(exchange: str):
+    """Download an exchange's instrument dump ahead of the first tool call - NFO also pre-matches the index underlyings"""
+    started = time.perf_counter()
+    try:
+        get_instrument_table(exchange)
+        if exchange == "NFO":
+            for underlying in _FNO_SEARCH_ALIASES:
+                get_fno_instruments(underlying)
+    except Exception as e:
+        logger.warning(f"{exchange} instrument prefetch failed: {e}")
+        return
+    logger.info(f"{exchange} instruments prefetched in {time.perf_counter() - started:.2f}s")
+
+_get_close = itemgetter('close')
+_get_strike = itemgetter('strike')
+
+def analyze_price_data(instrument_data: Dict, historical_data: List[Dict]) -> Dict:
+    """Perform sequential thinking analysis on price data - builds its steps locally, safe to call concurrently"""
+    
+    current_price = instrument_data.get('last_price', 0)
+    prev_close = instrument_data.get('ohlc', {}).get('close', 0)
+    
+    recent = historical_data[-5:] if historical_data and len(historical_data) >= 5 else []
+    recent_closes = np.fromiter(map(_get_close, recent), dtype=np.float64, count=len(recent))
+    trend_direction, volatility, change_percent = kernels.price_stats(
+        recent_closes, float(current_price), float(prev_close)
+    )
+    trend = {1: "Upward", -1: "Downward"}.get(trend_direction, "Neutral")
+    
+    volume = instrument_data.get('volume', 0)
+    avg_volume = instrument_data.get('average_price', 0)  # Using as proxy
+    volume_status = 'High' if volume > avg_volume * 1.5 else 'Normal'
+    
+    recommendation = _generate_recommendation(change_percent, trend, volume)
+    
+    # (thought, analysis, conclusion, next_action) - the historical step only applies with 5+ candles
+    steps = [(
+        f"Analyzing current price movement for {instrument_data.get('tradingsymbol', 'Unknown')}",
+        f"Current Price: ₹{current_price}, Previous Close: ₹{prev_close}, Change: {change_percent:.2f}%",
+        "Current price momentum established",
+        "Analyze historical trends"
+    )]
+    if recent:
+        steps.append((
+            "Examining 5-day historical trend pattern",
+            f"5-day trend: {trend}, Recent volatility: ₹{volatility:.2f}",
+            f"Stock shows {trend.lower()} momentum with {'high' if volatility > current_price * 0.05 else 'moderate'} volatility",
+            "Evaluate volume patterns"
+        ))
+    steps.append((
+        "Assessing trading volume relative to average",
+        f"Current Volume: {volume}, Volume indicates {volume_status.lower()} trading activity",
+        "Volume analysis provides market sentiment insight",
+        "Generate trading recommendation"
+    ))
+    steps.append((
+        "Synthesizing all analysis into actionable recommendation",
+        f"Price trend: {change_percent:.2f}%, Historical pattern: {trend}, Volume: {volume_status}",
+        f"Recommendation: {recommendation['action']} - {recommendation['reasoning']}",
+        recommendation['suggested_action']
+    ))
+    
+    return {
+        'thinking_steps': [
+            {
+                'step': number,
+                'thought': thought,
+                'analysis': analysis,
+                'conclusion': conclusion,
+                'next_action': next_action
+            } for number, (thought, analysis, conclusion, next_action) in enumerate(steps, start=1)
+        ],
+        'final_recommendation': recommendation,
+        'analysis_summary': {
+            'current_price': current_price,
+            'change_percent': change_percent,
+            'trend': trend,
+            'volume_status': volume_status,
+            'volatility': volatility
+        }
+    }
+
+def _generate_recommendation(change_percent: float, trend: str, volume: int) -> Dict:
+    """Generate trading recommendation based on analysis"""
+    if change_percent > 2 and trend == "Upward":
+        return {
+            'action': 'BUY',
+            'reasoning': 'Strong upward momentum with positive trend',
+            'suggested_action': 'Consider buying with stop-loss at recent support'
+        }
+    elif change_percent < -2 and trend == "Downward":
+        return {
+            'action': 'SELL',
+            'reasoning': 'Negative momentum with downward trend',
+            'suggested_action': 'Consider selling or shorting with stop-loss'
+        }
+    else:
+        return {
+            'action': 'HOLD',
+            'reasoning': 'Neutral momentum, wait for clearer signals',
+            'suggested_action': 'Monitor for breakout or breakdown signals'
+        }
+
 class SequentialAnalyzer:
-    """Legacy analyzer for backward compatibility"""
+    """Legacy analyzer for backward compatibility - analysis delegates to the stateless analyze_price_data"""
     
     def __init__(self):
         self.thinking_steps: List[ThinkingStep] = []
@@ -190,384 +653,316 @@ class SequentialAnalyzer:
     
     def analyze_price_data(self, instrument_data: Dict, historical_data: List[Dict]) -> Dict:
         """Perform sequential thinking analysis on price data"""
-        
-        current_price = instrument_data.get('last_price', 0)
-        prev_close = instrument_data.get('ohlc', {}).get('close', 0)
-        change_percent = ((current_price - prev_close) / prev_close * 100) if prev_close else 0
-        
-        step1 = self.add_thinking_step(
-            thought=f"Analyzing current price movement for {instrument_data.get('tradingsymbol', 'Unknown')}",
-            analysis=f"Current Price: ₹{current_price}, Previous Close: ₹{prev_close}, Change: {change_percent:.2f}%",
-            conclusion="Current price momentum established",
-            next_action="Analyze historical trends"
-        )
-        
-        if historical_data and len(historical_data) >= 5:
-            recent_closes = [candle['close'] for candle in historical_data[-5:]]
-            trend = "Upward" if recent_closes[-1] > recent_closes[0] else "Downward"
-            volatility = max(recent_closes) - min(recent_closes)
-            
-            step2 = self.add_thinking_step(
-                thought="Examining 5-day historical trend pattern",
-                analysis=f"5-day trend: {trend}, Recent volatility: ₹{volatility:.2f}",
-                conclusion=f"Stock shows {trend.lower()} momentum with {'high' if volatility > current_price * 0.05 else 'moderate'} volatility",
-                next_action="Evaluate volume patterns"
-            )
-        
-        volume = instrument_data.get('volume', 0)
-        avg_volume = instrument_data.get('average_price', 0)  # Using as proxy
-        
-        step3 = self.add_thinking_step(
-            thought="Assessing trading volume relative to average",
-            analysis=f"Current Volume: {volume}, Volume indicates {'high' if volume > avg_volume * 1.5 else 'normal'} trading activity",
-            conclusion="Volume analysis provides market sentiment insight",
-            next_action="Generate trading recommendation"
-        )
-        
-        recommendation = self._generate_recommendation(change_percent, trend if 'trend' in locals() else 'Neutral', volume)
-        
-        step4 = self.add_thinking_step(
-            thought="Synthesizing all analysis into actionable recommendation",
-            analysis=f"Price trend: {change_percent:.2f}%, Historical pattern: {trend if 'trend' in locals() else 'Neutral'}, Volume: {'High' if volume > avg_volume * 1.5 else 'Normal'}",
-            conclusion=f"Recommendation: {recommendation['action']} - {recommendation['reasoning']}",
-            next_action=recommendation['suggested_action']
-        )
-        
-        return {
-            'thinking_steps': [
-                {
-                    'step': step.step_number,
-                    'thought': step.thought,
-                    'analysis': step.analysis,
-                    'conclusion': step.conclusion,
-                    'next_action': step.next_action
-                } for step in self.thinking_steps
-            ],
-            'final_recommendation': recommendation,
-            'analysis_summary': {
-                'current_price': current_price,
-                'change_percent': change_percent,
-                'trend': trend if 'trend' in locals() else 'Neutral',
-                'volume_status': 'High' if volume > avg_volume * 1.5 else 'Normal',
-                'volatility': volatility if 'volatility' in locals() else 0
-            }
-        }
+        return analyze_price_data(instrument_data, historical_data)
     
     def _generate_recommendation(self, change_percent: float, trend: str, volume: int) -> Dict:
         """Generate trading recommendation based on analysis"""
-        if change_percent > 2 and trend == "Upward":
-            return {
-                'action': 'BUY',
-                'reasoning': 'Strong upward momentum with positive trend',
-                'suggested_action': 'Consider buying with stop-loss at recent support'
-            }
-        elif change_percent < -2 and trend == "Downward":
-            return {
-                'action': 'SELL',
-                'reasoning': 'Negative momentum with downward trend',
-                'suggested_action': 'Consider selling or shorting with stop-loss'
-            }
-        else:
-            return {
-                'action': 'HOLD',
-                'reasoning': 'Neutral momentum, wait for clearer signals',
-                'suggested_action': 'Monitor for breakout or breakdown signals'
-            }
+        return _generate_recommendation(change_percent, trend, volume)
 
 analyzer = SequentialAnalyzer()  # For backward compatibility  
 indicator_calculator = TechnicalIndicatorCalculator()
 
 app = Server("zerodha-kite-mcp")
 
-@app.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools"""
-    return [
-        Tool(
-            name="get_market_data",
-            description="Get real-time quotes and historical data for equity instruments - raw data for AI analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Trading symbol (e.g., 'NIFTY 50', 'RELIANCE', 'TCS')"
-                    },
-                    "exchange": {
-                        "type": "string",
-                        "description": "Exchange (NSE, BSE)",
-                        "default": "NSE"
-                    },
-                    "interval": {
-                        "type": "string",
-                        "description": "Time interval (minute, day, 3minute, 5minute, 15minute, 30minute, 60minute)",
-                        "default": "day"
-                    },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days of historical data",
-                        "default": 30
-                    }
+# Tool schemas are static - build them once at import instead of on every list_tools request
+_TOOLS: list[Tool] = [
+    Tool(
+        name="get_market_data",
+        description="Get real-time quotes and historical data for equity instruments - raw data for AI analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Trading symbol (e.g., 'NIFTY 50', 'RELIANCE', 'TCS')"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        Tool(
-            name="get_fno_data",
-            description="Get futures and options data for F&O trading - includes expiry, strike prices, premiums",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Underlying symbol (e.g., 'NIFTY', 'BANKNIFTY', 'RELIANCE')"
-                    },
-                    "instrument_type": {
-                        "type": "string",
-                        "description": "Instrument type: 'FUT' for futures, 'CE' for call options, 'PE' for put options, 'ALL' for all types",
-                        "default": "ALL"
-                    },
-                    "expiry": {
-                        "type": "string",
-                        "description": "Expiry date filter (YYYY-MM-DD format, optional)"
-                    }
+                "exchange": {
+                    "type": "string",
+                    "description": "Exchange (NSE, BSE)",
+                    "default": "NSE"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        Tool(
-            name="get_options_chain",
-            description="Get complete options chain data with Greeks for options trading analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Underlying symbol (e.g., 'NIFTY', 'BANKNIFTY')"
-                    },
-                    "expiry": {
-                        "type": "string",
-                        "description": "Expiry date (YYYY-MM-DD format)"
-                    }
+                "interval": {
+                    "type": "string",
+                    "description": "Time interval (minute, day, 3minute, 5minute, 15minute, 30minute, 60minute)",
+                    "default": "day"
                 },
-                "required": ["symbol", "expiry"]
-            }
-        ),
-        Tool(
-            name="calculate_technical_indicators",
-            description="Calculate raw technical indicators (RSI, MACD, etc.) - provides numerical data for AI analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "symbol": {
-                        "type": "string",
-                        "description": "Trading symbol"
-                    },
-                    "interval": {
-                        "type": "string",
-                        "description": "Time interval for analysis",
-                        "default": "day"
-                    },
-                    "days": {
-                        "type": "integer",
-                        "description": "Number of days of data for calculation",
-                        "default": 50
-                    }
+                "days": {
+                    "type": "integer",
+                    "description": "Number of days of historical data",
+                    "default": 30
+                }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    Tool(
+        name="get_fno_data",
+        description="Get futures and options data for F&O trading - includes expiry, strike prices, premiums",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Underlying symbol (e.g., 'NIFTY', 'BANKNIFTY', 'RELIANCE')"
                 },
-                "required": ["symbol"]
-            }
-        ),
-        Tool(
-            name="monitor_orders",
-            description="Monitor placed orders and their status",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "order_id": {
-                        "type": "string",
-                        "description": "Specific order ID to monitor (optional)"
-                    }
+                "instrument_type": {
+                    "type": "string",
+                    "description": "Instrument type: 'FUT' for futures, 'CE' for call options, 'PE' for put options, 'ALL' for all types",
+                    "default": "ALL"
+                },
+                "expiry": {
+                    "type": "string",
+                    "description": "Expiry date filter (YYYY-MM-DD format, optional)"
                 }
-            }
-        ),
-        Tool(
-            name="place_order",
-            description="Place orders for equity, futures, or options - unified order placement tool",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tradingsymbol": {
-                        "type": "string",
-                        "description": "Trading symbol (e.g., 'RELIANCE', 'NIFTY24SEP24FUT', 'NIFTY24SEP2424000CE')"
-                    },
-                    "exchange": {
-                        "type": "string",
-                        "description": "Exchange (NSE for equity, NFO for F&O)",
-                        "default": "NSE"
-                    },
-                    "transaction_type": {
-                        "type": "string",
-                        "description": "BUY or SELL"
-                    },
-                    "quantity": {
-                        "type": "integer",
-                        "description": "Quantity (consider lot size for F&O)"
-                    },
-                    "order_type": {
-                        "type": "string",
-                        "description": "MARKET, LIMIT, SL, SL-M",
-                        "default": "MARKET"
-                    },
-                    "price": {
-                        "type": "number",
-                        "description": "Price for LIMIT orders"
-                    },
-                    "trigger_price": {
-                        "type": "number",
-                        "description": "Trigger price for SL orders"
-                    },
-                    "product": {
-                        "type": "string",
-                        "description": "MIS (intraday), CNC (delivery), NRML (normal F&O)",
-                        "default": "MIS"
-                    }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    Tool(
+        name="get_options_chain",
+        description="Get complete options chain data with Greeks for options trading analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Underlying symbol (e.g., 'NIFTY', 'BANKNIFTY')"
+                },
+                "expiry": {
+                    "type": "string",
+                    "description": "Expiry date (YYYY-MM-DD format)"
+                }
+            },
+            "required": ["symbol", "expiry"]
+        }
+    ),
+    Tool(
+        name="calculate_technical_indicators",
+        description="Calculate raw technical indicators (RSI, MACD, etc.) - provides numerical data for AI analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "symbol": {
+                    "type": "string",
+                    "description": "Trading symbol"
+                },
+                "interval": {
+                    "type": "string",
+                    "description": "Time interval for analysis",
+                    "default": "day"
+                },
+                "days": {
+                    "type": "integer",
+                    "description": "Number of days of data for calculation",
+                    "default": 50
                 },
-                "required": ["tradingsymbol", "transaction_type", "quantity"]
+                "tail": {
+                    "type": "integer",
+                    "description": "Number of most recent values to return per indicator",
+                    "default": 200
+                }
+            },
+            "required": ["symbol"]
+        }
+    ),
+    Tool(
+        name="monitor_orders",
+        description="Monitor placed orders and their status",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "order_id": {
+                    "type": "string",
+                    "description": "Specific order ID to monitor (optional)"
+                }
             }
-        ),
-        Tool(
-            name="get_positions",
-            description="Get current positions (equity and F&O) - raw position data for portfolio analysis",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "position_type": {
-                        "type": "string",
-                        "description": "Type of positions: 'day' for intraday, 'net' for overnight, 'all' for both",
-                        "default": "all"
-                    }
+        }
+    ),
+    Tool(
+        name="place_order",
+        description="Place orders for equity, futures, or options - unified order placement tool",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tradingsymbol": {
+                    "type": "string",
+                    "description": "Trading symbol (e.g., 'RELIANCE', 'NIFTY24SEP24FUT', 'NIFTY24SEP2424000CE')"
+                },
+                "exchange": {
+                    "type": "string",
+                    "description": "Exchange (NSE for equity, NFO for F&O)",
+                    "default": "NSE"
+                },
+                "transaction_type": {
+                    "type": "string",
+                    "description": "BUY or SELL"
+                },
+                "quantity": {
+                    "type": "integer",
+                    "description": "Quantity (consider lot size for F&O)"
+                },
+                "order_type": {
+                    "type": "string",
+                    "description": "MARKET, LIMIT, SL, SL-M",
+                    "default": "MARKET"
+                },
+                "price": {
+                    "type": "number",
+                    "description": "Price for LIMIT orders"
+                },
+                "trigger_price": {
+                    "type": "number",
+                    "description": "Trigger price for SL orders"
+                },
+                "product": {
+                    "type": "string",
+                    "description": "MIS (intraday), CNC (delivery), NRML (normal F&O)",
+                    "default": "MIS"
+                }
+            },
+            "required": ["tradingsymbol", "transaction_type", "quantity"]
+        }
+    ),
+    Tool(
+        name="get_positions",
+        description="Get current positions (equity and F&O) - raw position data for portfolio analysis",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "position_type": {
+                    "type": "string",
+                    "description": "Type of positions: 'day' for intraday, 'net' for overnight, 'all' for both",
+                    "default": "all"
                 }
             }
-        ),
-        Tool(
-            name="get_margins",
-            description="Get account margin details for position sizing calculations",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "segment": {
-                        "type": "string",
-                        "description": "Market segment: 'equity', 'commodity', or 'all'",
-                        "default": "all"
-                    }
+        }
+    ),
+    Tool(
+        name="get_margins",
+        description="Get account margin details for position sizing calculations",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "segment": {
+                    "type": "string",
+                    "description": "Market segment: 'equity', 'commodity', or 'all'",
+                    "default": "all"
                 }
             }
-        ),
-        Tool(
-            name="get_risk_status",
-            description="Get comprehensive risk management status and trading limits",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "include_history": {
-                        "type": "boolean",
-                        "description": "Include recent trade history in response",
-                        "default": False
-                    }
+        }
+    ),
+    Tool(
+        name="get_risk_status",
+        description="Get comprehensive risk management status and trading limits",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "include_history": {
+                    "type": "boolean",
+                    "description": "Include recent trade history in response",
+                    "default": False
                 }
             }
-        ),
-        Tool(
-            name="set_stop_loss",
-            description="Set stop loss and target orders for existing positions",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tradingsymbol": {
-                        "type": "string",
-                        "description": "Trading symbol for the position"
-                    },
-                    "stop_loss_price": {
-                        "type": "number",
-                        "description": "Stop loss trigger price"
-                    },
-                    "target_price": {
-                        "type": "number",
-                        "description": "Target profit price (optional)"
-                    },
-                    "quantity": {
-                        "type": "integer",
-                        "description": "Quantity to protect (auto-detect if not provided)"
-                    },
-                    "order_type": {
-                        "type": "string",
-                        "description": "Stop loss order type: SL (Stop Loss) or SL-M (Stop Loss Market)",
-                        "default": "SL-M"
-                    }
+        }
+    ),
+    Tool(
+        name="set_stop_loss",
+        description="Set stop loss and target orders for existing positions",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tradingsymbol": {
+                    "type": "string",
+                    "description": "Trading symbol for the position"
                 },
-                "required": ["tradingsymbol", "stop_loss_price"]
-            }
-        ),
-        Tool(
-            name="monitor_stop_orders",
-            description="Monitor active stop loss and target orders",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tradingsymbol": {
-                        "type": "string",
-                        "description": "Filter by specific trading symbol (optional)"
-                    }
+                "stop_loss_price": {
+                    "type": "number",
+                    "description": "Stop loss trigger price"
+                },
+                "target_price": {
+                    "type": "number",
+                    "description": "Target profit price (optional)"
+                },
+                "quantity": {
+                    "type": "integer",
+                    "description": "Quantity to protect (auto-detect if not provided)"
+                },
+                "order_type": {
+                    "type": "string",
+                    "description": "Stop loss order type: SL (Stop Loss) or SL-M (Stop Loss Market)",
+                    "default": "SL-M"
+                }
+            },
+            "required": ["tradingsymbol", "stop_loss_price"]
+        }
+    ),
+    Tool(
+        name="monitor_stop_orders",
+        description="Monitor active stop loss and target orders",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tradingsymbol": {
+                    "type": "string",
+                    "description": "Filter by specific trading symbol (optional)"
                 }
             }
-        )
-    ]
+        }
+    )
+]
+
+@app.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools"""
+    return _TOOLS
 
 @app.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[types.TextContent]:
     """Handle tool calls"""
     
-    if not kite:
-        init_kite()
+    await ensure_kite()
     
     try:
-        if name == "get_market_data":
-            return await get_market_data_tool(arguments)
-        elif name == "get_fno_data":
-            return await get_fno_data_tool(arguments)
-        elif name == "get_options_chain":
-            return await get_options_chain_tool(arguments)
-        elif name == "calculate_technical_indicators":
-            return await calculate_technical_indicators_tool(arguments)
-        elif name == "monitor_orders":
-            return await monitor_orders_tool(arguments)
-        elif name == "place_order":
-            return await place_order_tool(arguments)
-        elif name == "get_positions":
-            return await get_positions_tool(arguments)
-        elif name == "get_margins":
-            return await get_margins_tool(arguments)
-        elif name == "get_risk_status":
-            return await get_risk_status_tool(arguments)
-        elif name == "set_stop_loss":
-            return await set_stop_loss_tool(arguments)
-        elif name == "monitor_stop_orders":
-            return await monitor_stop_orders_tool(arguments)
-        elif name == "fetch_data":
-            return await get_market_data_tool(arguments)
-        elif name == "analyze_data":
-            return await analyze_data_tool(arguments)
-        elif name == "buy_stock" or name == "sell_stock":
-            args = arguments.copy()
-            args["tradingsymbol"] = args.pop("symbol", "")
-            args["transaction_type"] = "BUY" if name == "buy_stock" else "SELL"
-            return await place_order_tool(args)
-        else:
+        handler = _TOOL_TABLE.get(name)
+        if handler is None:
             return [types.TextContent(type="text", text=f"Unknown tool: {name}")]
+        return await handler(arguments)
     except Exception as e:
         logger.error(f"Error in tool {name}: {str(e)}")
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
 
+def order_details_text(tradingsymbol: str, exchange: str, transaction_type: str, quantity: int,
+                       order_type: str, price: Optional[float], product: str, timestamp: str) -> str:
+    """Order detail block shared by the live and dry-run place_order responses"""
+    return (
+        f"**Symbol:** {tradingsymbol}\n"
+        f"**Exchange:** {exchange}\n"
+        f"**Type:** {transaction_type}\n"
+        f"**Quantity:** {quantity}\n"
+        f"**Order Type:** {order_type}\n"
+        f"**Price:** {'₹' + str(price) if price else 'Market Price'}\n"
+        f"**Product:** {product}\n"
+        f"**Time:** {timestamp}\n\n"
+    )
+
+async def fetch_market_snapshot(exchange: str, symbol: str, days: int, interval: str = "day",
+                                match_name: bool = False) -> Optional[Tuple[Dict, str, Dict, List[Dict]]]:
+    """Resolve an instrument, then fetch its quote and candle history concurrently - None if not found"""
+    instrument = await run_kite(find_instrument, exchange, symbol, match_name=match_name)
+    if not instrument:
+        return None
+    
+    quote_key = f"{exchange}:{instrument['tradingsymbol']}"
+    to_date = datetime.now()
+    from_date = to_date - timedelta(days=days)
+    
+    # Quote and history only need the resolved instrument - fetch them concurrently
+    quote, historical_data = await asyncio.gather(
+        run_kite(get_quotes, [quote_key]),
+        run_kite(get_historical_data, instrument['instrument_token'], from_date, to_date, interval)
+    )
+    return instrument, quote_key, quote, historical_data
+
 async def get_market_data_tool(arguments: dict) -> list[types.TextContent]:
     """Fetch stock/index data"""
     symbol = arguments.get("symbol")
@@ -576,30 +971,17 @@ async def get_market_data_tool(arguments: dict) -> list[types.TextContent]:
     days = arguments.get("days", 30)
     
     try:
-        instruments = kite.instruments(exchange)
-        instrument = None
-        
-        for inst in instruments:
-            if symbol.upper() in inst['tradingsymbol'].upper() or symbol.upper() in inst['name'].upper():
-                instrument = inst
-                break
+        snapshot = await fetch_market_snapshot(exchange, symbol, days, interval, match_name=True)
         
-        if not instrument:
+        if not snapshot:
             return [types.TextContent(type="text", text=f"Instrument {symbol} not found on {exchange}")]
         
-        instrument_token = instrument['instrument_token']
+        instrument, quote_key, quote, historical_data = snapshot
         
-        quote = kite.quote(f"{exchange}:{instrument['tradingsymbol']}")
-        
-        from_date = datetime.now() - timedelta(days=days)
-        to_date = datetime.now()
-        
-        historical_data = kite.historical_data(
-            instrument_token=instrument_token,
-            from_date=from_date,
-            to_date=to_date,
-            interval=interval
-        )
+        q = quote[quote_key]
+        net_change = q['net_change']
+        prev_close = q['ohlc']['close']
+        change_pct = net_change / prev_close * 100 if prev_close else 0.0
         
         result = {
             "instrument_info": instrument,
@@ -612,12 +994,11 @@ async def get_market_data_tool(arguments: dict) -> list[types.TextContent]:
         return [types.TextContent(
             type="text",
             text=f"📈 **Data fetched for {symbol}**\n\n"
-                 f"**Current Price:** ₹{quote[f'{exchange}:{instrument['tradingsymbol']}']['last_price']}\n"
-                 f"**Change:** {quote[f'{exchange}:{instrument['tradingsymbol']}']['net_change']} "
-                 f"({quote[f'{exchange}:{instrument['tradingsymbol']}']['net_change']/quote[f'{exchange}:{instrument['tradingsymbol']}']['ohlc']['close']*100:.2f}%)\n"
-                 f"**Volume:** {quote[f'{exchange}:{instrument['tradingsymbol']}']['volume']:,}\n"
+                 f"**Current Price:** ₹{q['last_price']}\n"
+                 f"**Change:** {net_change} ({change_pct:.2f}%)\n"
+                 f"**Volume:** {q['volume']:,}\n"
                  f"**Historical Records:** {len(historical_data)} days\n\n"
-                 f"**Raw Data:**\n```json\n{json.dumps(result, indent=2, default=str)}\n```"
+                 f"**Raw Data:**\n```json\n{dump_json(result, indent=False)}\n```"
         )]
         
     except Exception as e:
@@ -629,35 +1010,15 @@ async def analyze_data_tool(arguments: dict) -> list[types.TextContent]:
     analysis_type = arguments.get("analysis_type", "technical")
     
     try:
-        fetch_args = {"symbol": symbol, "days": 10}
-        data_result = await fetch_data_tool(fetch_args)
-        
+        snapshot = await fetch_market_snapshot("NSE", symbol, 10)
         
-        instruments = kite.instruments("NSE")
-        instrument = None
-        
-        for inst in instruments:
-            if symbol.upper() in inst['tradingsymbol'].upper():
-                instrument = inst
-                break
-        
-        if not instrument:
+        if not snapshot:
             return [types.TextContent(type="text", text=f"Cannot analyze: {symbol} not found")]
         
-        quote_data = kite.quote(f"NSE:{instrument['tradingsymbol']}")
-        instrument_data = quote_data[f"NSE:{instrument['tradingsymbol']}"]
-        
-        from_date = datetime.now() - timedelta(days=10)
-        historical_data = kite.historical_data(
-            instrument_token=instrument['instrument_token'],
-            from_date=from_date,
-            to_date=datetime.now(),
-            interval="day"
-        )
+        instrument, quote_key, quote, historical_data = snapshot
+        instrument_data = quote[quote_key]
         
-        global analyzer
-        analyzer = SequentialAnalyzer()  # Reset for new analysis
-        analysis_result = analyzer.analyze_price_data(instrument_data, historical_data)
+        analysis_result = analyze_price_data(instrument_data, historical_data)
         
         thinking_steps_text = ""
         for step in analysis_result['thinking_steps']:
@@ -685,7 +1046,7 @@ async def analyze_data_tool(arguments: dict) -> list[types.TextContent]:
                  f"- Trend: {summary['trend']}\n"
                  f"- Volume: {summary['volume_status']}\n"
                  f"- Volatility: ₹{summary['volatility']:.2f}\n\n"
-                 f"*Analysis completed at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
+                 f"*Analysis completed at {datetime.now().strftime(TIMESTAMP_FORMAT)}*"
         )]
         
     except Exception as e:
@@ -697,134 +1058,35 @@ async def monitor_orders_tool(arguments: dict) -> list[types.TextContent]:
     
     try:
         if order_id:
-            order_history = kite.order_history(order_id)
+            order_history = await run_kite(kite.order_history, order_id)
             return [types.TextContent(
                 type="text",
-                text=f"📊 **Order {order_id} Status:**\n\n```json\n{json.dumps(order_history, indent=2, default=str)}\n```"
+                text=f"📊 **Order {order_id} Status:**\n\n```json\n{dump_json(order_history)}\n```"
             )]
         else:
-            orders = kite.orders()
+            orders = await run_kite(kite.orders)
             
             if not orders:
                 return [types.TextContent(type="text", text="📊 **No orders found**")]
             
-            orders_text = "📊 **All Orders:**\n\n"
+            parts = ["📊 **All Orders:**\n\n"]
             for order in orders[-10:]:  # Last 10 orders
-                orders_text += f"**Order ID:** {order['order_id']}\n"
-                orders_text += f"**Symbol:** {order['tradingsymbol']}\n"
-                orders_text += f"**Transaction:** {order['transaction_type']}\n"
-                orders_text += f"**Quantity:** {order['quantity']}\n"
-                orders_text += f"**Status:** {order['status']}\n"
-                orders_text += f"**Price:** ₹{order.get('price', 'N/A')}\n"
-                orders_text += f"**Time:** {order['order_timestamp']}\n\n"
+                parts.append(
+                    f"**Order ID:** {order['order_id']}\n"
+                    f"**Symbol:** {order['tradingsymbol']}\n"
+                    f"**Transaction:** {order['transaction_type']}\n"
+                    f"**Quantity:** {order['quantity']}\n"
+                    f"**Status:** {order['status']}\n"
+                    f"**Price:** ₹{order.get('price', 'N/A')}\n"
+                    f"**Time:** {order['order_timestamp']}\n\n"
+                )
+            orders_text = "".join(parts)
             
             return [types.TextContent(type="text", text=orders_text)]
             
     except Exception as e:
         return [types.TextContent(type="text", text=f"Monitoring error: {str(e)}")]
 
-async def buy_stock_tool(arguments: dict) -> list[types.TextContent]:
-    """Place buy order"""
-    symbol = arguments.get("symbol")
-    quantity = arguments.get("quantity")
-    order_type = arguments.get("order_type", "MARKET")
-    price = arguments.get("price")
-    product = arguments.get("product", "CNC")
-    
-    try:
-        instruments = kite.instruments("NSE")
-        instrument = None
-        
-        for inst in instruments:
-            if symbol.upper() in inst['tradingsymbol'].upper():
-                instrument = inst
-                break
-        
-        if not instrument:
-            return [types.TextContent(type="text", text=f"Cannot buy: {symbol} not found")]
-        
-        order_params = {
-            "variety": "regular",
-            "tradingsymbol": instrument['tradingsymbol'],
-            "exchange": "NSE",
-            "transaction_type": "BUY",
-            "quantity": quantity,
-            "order_type": order_type,
-            "product": product
-        }
-        
-        if order_type == "LIMIT" and price:
-            order_params["price"] = price
-        
-        order_id = kite.place_order(**order_params)
-        
-        return [types.TextContent(
-            type="text",
-            text=f"✅ **Buy Order Placed Successfully!**\n\n"
-                 f"**Order ID:** {order_id}\n"
-                 f"**Symbol:** {instrument['tradingsymbol']}\n"
-                 f"**Quantity:** {quantity}\n"
-                 f"**Order Type:** {order_type}\n"
-                 f"**Product:** {product}\n"
-                 f"**Price:** {'₹' + str(price) if price else 'Market Price'}\n"
-                 f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                 f"Monitor this order using the monitor_orders tool with order_id: {order_id}"
-        )]
-        
-    except Exception as e:
-        return [types.TextContent(type="text", text=f"Buy order error: {str(e)}")]
-
-async def sell_stock_tool(arguments: dict) -> list[types.TextContent]:
-    """Place sell order"""
-    symbol = arguments.get("symbol")
-    quantity = arguments.get("quantity")
-    order_type = arguments.get("order_type", "MARKET")
-    price = arguments.get("price")
-    product = arguments.get("product", "CNC")
-    
-    try:
-        instruments = kite.instruments("NSE")
-        instrument = None
-        
-        for inst in instruments:
-            if symbol.upper() in inst['tradingsymbol'].upper():
-                instrument = inst
-                break
-        
-        if not instrument:
-            return [types.TextContent(type="text", text=f"Cannot sell: {symbol} not found")]
-        
-        order_params = {
-            "variety": "regular",
-            "tradingsymbol": instrument['tradingsymbol'],
-            "exchange": "NSE",
-            "transaction_type": "SELL",
-            "quantity": quantity,
-            "order_type": order_type,
-            "product": product
-        }
-        
-        if order_type == "LIMIT" and price:
-            order_params["price"] = price
-        
-        order_id = kite.place_order(**order_params)
-        
-        return [types.TextContent(
-            type="text",
-            text=f"✅ **Sell Order Placed Successfully!**\n\n"
-                 f"**Order ID:** {order_id}\n"
-                 f"**Symbol:** {instrument['tradingsymbol']}\n"
-                 f"**Quantity:** {quantity}\n"
-                 f"**Order Type:** {order_type}\n"
-                 f"**Product:** {product}\n"
-                 f"**Price:** {'₹' + str(price) if price else 'Market Price'}\n"
-                 f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-                 f"Monitor this order using the monitor_orders tool with order_id: {order_id}"
-        )]
-        
-    except Exception as e:
-        return [types.TextContent(type="text", text=f"Sell order error: {str(e)}")]
-
 async def get_fno_data_tool(arguments: dict) -> list[types.TextContent]:
     """Get F&O instruments data"""
     symbol = arguments.get("symbol")
@@ -832,10 +1094,9 @@ async def get_fno_data_tool(arguments: dict) -> list[types.TextContent]:
     expiry_filter = arguments.get("expiry")
     
     try:
-        if not kite:
-            init_kite()
+        await ensure_kite()
             
-        fno_instruments = get_fno_instruments(symbol)
+        fno_instruments = await run_kite(get_fno_instruments, symbol)
         
         if not fno_instruments:
             return [types.TextContent(type="text", text=f"No F&O instruments found for {symbol}")]
@@ -846,30 +1107,45 @@ async def get_fno_data_tool(arguments: dict) -> list[types.TextContent]:
         if expiry_filter:
             fno_instruments = [inst for inst in fno_instruments if inst['expiry'] == expiry_filter]
         
+        selected = fno_instruments[:20]  # Limit to 20 instruments
+        quote_keys = [f"NFO:{inst['tradingsymbol']}" for inst in selected]
+        quotes = await fetch_quotes(quote_keys)
+        
         result_data = []
-        for inst in fno_instruments[:20]:  # Limit to 20 instruments
-            try:
-                quote_key = f"NFO:{inst['tradingsymbol']}"
-                quote = kite.quote(quote_key)
-                if quote_key in quote:
-                    inst_data = inst.copy()
-                    inst_data.update({
-                        'current_price': quote[quote_key].get('last_price', 0),
-                        'ohlc': quote[quote_key].get('ohlc', {}),
-                        'volume': quote[quote_key].get('volume', 0),
-                        'bid': quote[quote_key].get('depth', {}).get('buy', [{}])[0].get('price', 0),
-                        'ask': quote[quote_key].get('depth', {}).get('sell', [{}])[0].get('price', 0),
-                        'change': quote[quote_key].get('net_change', 0)
-                    })
-                    result_data.append(inst_data)
-            except Exception:
-                result_data.append(inst)  # Add without quote data if quote fails
+        for inst, quote_key in zip(selected, quote_keys):
+            # Only the contract fields a trader reads - tokens and tick sizes just pad the payload
+            inst_data = {
+                'tradingsymbol': inst['tradingsymbol'],
+                'instrument_type': inst['instrument_type'],
+                'expiry': inst['expiry'],
+                'strike': inst['strike'],
+                'lot_size': inst['lot_size']
+            }
+            q = quotes.get(quote_key)
+            if q is None:
+                result_data.append(inst_data)  # Add without quote data if quote fails
+                continue
+            
+            depth = q.get('depth') or {}
+            buys = depth.get('buy') or ()
+            sells = depth.get('sell') or ()
+            inst_data.update({
+                'current_price': q.get('last_price', 0),
+                'ohlc': q.get('ohlc') or {},
+                'volume': q.get('volume', 0),
+                'bid': buys[0].get('price', 0) if buys else 0,
+                'ask': sells[0].get('price', 0) if sells else 0,
+                'change': q.get('net_change', 0)
+            })
+            result_data.append(inst_data)
+        
+        payload = await dump_json_async(result_data)
         
         return [types.TextContent(
             type="text",
             text=f"📊 **F&O Data for {symbol}**\n\n"
                  f"**Found {len(result_data)} instruments**\n\n"
-                 f"```json\n{json.dumps(result_data, indent=2, default=str)}\n```"
+                 f"```json\n{payload}\n```"
         )]
         
     except Exception as e:
@@ -881,18 +1157,20 @@ async def get_options_chain_tool(arguments: dict) -> list[types.TextContent]:
     expiry = arguments.get("expiry")
     
     try:
-        fno_instruments = get_fno_instruments(symbol)
+        fno_instruments = await run_kite(get_fno_instruments, symbol)
         
         options = [inst for inst in fno_instruments 
-                  if inst['instrument_type'] in ['CE', 'PE'] and inst['expiry'] == expiry]
+                  if inst['instrument_type'] in _OPTION_TYPES and inst['expiry'] == expiry]
         
         if not options:
             return [types.TextContent(type="text", text=f"No options found for {symbol} expiry {expiry}")]
         
-        underlying_quote = kite.quote(f"NSE:{symbol}")
-        underlying_price = 0
-        if f"NSE:{symbol}" in underlying_quote:
-            underlying_price = underlying_quote[f"NSE:{symbol}"].get('last_price', 0)
+        # Limit to 50 options; sorting the slice by strike once keeps both partitions in strike order
+        options = sorted(options[:50], key=_get_strike)
+        underlying_key = f"NSE:{symbol}"
+        all_keys = [underlying_key] + [f"NFO:{o['tradingsymbol']}" for o in options]
+        quotes = await fetch_quotes(all_keys)
+        underlying_price = quotes.get(underlying_key, {}).get('last_price', 0)
         
         chain_data = {
             'underlying': symbol,
@@ -902,19 +1180,20 @@ async def get_options_chain_tool(arguments: dict) -> list[types.TextContent]:
             'put_options': []
         }
         
-        for option in options[:50]:  # Limit to 50 options
+        for option in options:
             try:
-                quote_key = f"NFO:{option['tradingsymbol']}"
-                quote = kite.quote(quote_key)
-                
-                option_data = {
-                    'strike': option['strike'],
-                    'premium': quote[quote_key].get('last_price', 0) if quote_key in quote else 0,
-                    'change': quote[quote_key].get('net_change', 0) if quote_key in quote else 0,
-                    'volume': quote[quote_key].get('volume', 0) if quote_key in quote else 0,
-                    'oi': quote[quote_key].get('oi', 0) if quote_key in quote else 0,
-                    'tradingsymbol': option['tradingsymbol']
-                }
+                q = quotes.get(f"NFO:{option['tradingsymbol']}")
+                if q is None:
+                    option_data = OptionRow(option['strike'], 0, 0, 0, 0, option['tradingsymbol'])
+                else:
+                    option_data = OptionRow(
+                        option['strike'],
+                        q.get('last_price', 0),
+                        q.get('net_change', 0),
+                        q.get('volume', 0),
+                        q.get('oi', 0),
+                        option['tradingsymbol']
+                    )
                 
                 if option['instrument_type'] == 'CE':
                     chain_data['call_options'].append(option_data)
@@ -924,17 +1203,18 @@ async def get_options_chain_tool(arguments: dict) -> list[types.TextContent]:
             except Exception:
                 continue
         
-        chain_data['call_options'].sort(key=lambda x: x['strike'])
-        chain_data['put_options'].sort(key=lambda x: x['strike'])
-        
-        return [types.TextContent(
-            type="text",
-            text=f"🔗 **Options Chain for {symbol} - {expiry}**\n\n"
-                 f"**Underlying Price:** ₹{underlying_price}\n"
-                 f"**Calls:** {len(chain_data['call_options'])} options\n"
-                 f"**Puts:** {len(chain_data['put_options'])} options\n\n"
-                 f"```json\n{json.dumps(chain_data, indent=2, default=str)}\n```"
-        )]
+        rows = await asyncio.to_thread(options_ndjson, chain_data['call_options'], chain_data['put_options'])
+
+        return [
+            types.TextContent(
+                type="text",
+                text=f"🔗 **Options Chain for {symbol} - {expiry}**\n\n"
+                     f"**Underlying Price:** ₹{underlying_price}\n"
+                     f"**Calls:** {len(chain_data['call_options'])} options\n"
+                     f"**Puts:** {len(chain_data['put_options'])} options\n"
+            ),
+            *fenced_chunks(rows)
+        ]
         
     except Exception as e:
         return [types.TextContent(type="text", text=f"Options chain error: {str(e)}")]
@@ -944,67 +1224,61 @@ async def calculate_technical_indicators_tool(arguments: dict) -> list[types.Tex
     symbol = arguments.get("symbol")
     interval = arguments.get("interval", "day")
     days = arguments.get("days", 50)
+    tail = arguments.get("tail", 200)
     
     try:
-        if not kite:
-            init_kite()
-            
-        instruments = kite.instruments("NSE")
-        instrument = None
+        await ensure_kite()
         
-        for inst in instruments:
-            if symbol.upper() in inst['tradingsymbol'].upper():
-                instrument = inst
-                break
+        # Candle history and the live quote are fetched concurrently once the instrument resolves
+        snapshot = await fetch_market_snapshot("NSE", symbol, days, interval)
         
-        if not instrument:
+        if not snapshot:
             return [types.TextContent(type="text", text=f"Instrument {symbol} not found")]
         
-        from_date = datetime.now() - timedelta(days=days)
-        historical_data = kite.historical_data(
-            instrument_token=instrument['instrument_token'],
-            from_date=from_date,
-            to_date=datetime.now(),
-            interval=interval
-        )
+        instrument, quote_key, current_quote, historical_data = snapshot
         
         if not historical_data:
             return [types.TextContent(type="text", text=f"No historical data for {symbol}")]
         
-        df = pd.DataFrame(historical_data)
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+        candles = to_ohlcv_array(historical_data)
         
         global indicator_calculator
-        indicators = indicator_calculator.calculate_indicators(df)
+        indicators = indicator_calculator.calculate_indicators(
+            close=candles['close'],
+            high=candles['high'],
+            low=candles['low'],
+            volume=candles['volume'],
+            tail=tail
+        )
         
         if "error" in indicators:
             return [types.TextContent(type="text", text=f"Indicator calculation error: {indicators['error']}")]
         
-        current_quote = kite.quote(f"NSE:{instrument['tradingsymbol']}")
-        current_data = current_quote.get(f"NSE:{instrument['tradingsymbol']}", {})
+        current_data = current_quote.get(quote_key, {})
         
-        result = {
+        summary = {
             'symbol': symbol,
             'current_price': current_data.get('last_price', 0),
             'current_change': current_data.get('net_change', 0),
             'volume': current_data.get('volume', 0),
-            'technical_indicators': indicators,
-            'data_points': len(df),
+            'data_points': len(candles),
             'calculation_time': datetime.now().isoformat()
         }
         
-        return [types.TextContent(
-            type="text",
-            text=f"📈 **Technical Indicators for {symbol}**\n\n"
-                 f"**Current Price:** ₹{current_data.get('last_price', 0)}\n"
-                 f"**Change:** {current_data.get('net_change', 0)}\n"
-                 f"**Data Points:** {len(df)} periods\n\n"
-                 f"**Raw Indicator Values:**\n"
-                 f"```json\n{json.dumps(result, indent=2, default=str)}\n```\n\n"
-                 f"*Note: These are raw numerical values for AI analysis. No interpretations provided.*"
-        )]
+        rows = await asyncio.to_thread(indicators_ndjson, summary, indicators)
+        
+        return [
+            types.TextContent(
+                type="text",
+                text=f"📈 **Technical Indicators for {symbol}**\n\n"
+                     f"**Current Price:** ₹{current_data.get('last_price', 0)}\n"
+                     f"**Change:** {current_data.get('net_change', 0)}\n"
+                     f"**Data Points:** {len(candles)} periods\n\n"
+                     f"**Raw Indicator Values:**\n"
+                     f"*Note: These are raw numerical values for AI analysis. No interpretations provided.*"
+            ),
+            *fenced_chunks(rows)
+        ]
         
     except Exception as e:
         return [types.TextContent(type="text", text=f"Technical indicators error: {str(e)}")]
@@ -1019,10 +1293,11 @@ async def place_order_tool(arguments: dict) -> list[types.TextContent]:
     price = arguments.get("price")
     trigger_price = arguments.get("trigger_price")
     product = arguments.get("product", "MIS")
+    now = datetime.now()
+    timestamp = now.strftime(TIMESTAMP_FORMAT)
     
     try:
-        if not kite:
-            init_kite()
+        await ensure_kite()
         
         order_params = {
             "variety": "regular",
@@ -1037,7 +1312,7 @@ async def place_order_tool(arguments: dict) -> list[types.TextContent]:
         if order_type.upper() == "LIMIT" and price:
             order_params["price"] = price
         
-        if order_type.upper() in ["SL", "SL-M"] and trigger_price:
+        if order_type.upper() in _SL_TYPES and trigger_price:
             order_params["trigger_price"] = trigger_price
         
         if config.enable_risk_checks:
@@ -1050,31 +1325,24 @@ async def place_order_tool(arguments: dict) -> list[types.TextContent]:
                          f"**Reason:** {validation_message}\n"
                          f"**Symbol:** {tradingsymbol}\n"
                          f"**Quantity:** {quantity}\n"
-                         f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                         f"**Time:** {timestamp}\n\n"
                          f"Risk Status: Use get_margins tool to check account status."
                 )]
         
         if config.dry_run_mode:
-            fake_order_id = f"DRY_{int(datetime.now().timestamp())}"
+            fake_order_id = f"DRY_{int(now.timestamp())}"
             risk_manager.record_order(order_params, fake_order_id, "DRY_RUN")
             
             return [types.TextContent(
                 type="text",
                 text=f"🧪 **DRY RUN - Order Simulated**\n\n"
                      f"**Simulated Order ID:** {fake_order_id}\n"
-                     f"**Symbol:** {tradingsymbol}\n"
-                     f"**Exchange:** {exchange}\n"
-                     f"**Type:** {transaction_type}\n"
-                     f"**Quantity:** {quantity}\n"
-                     f"**Order Type:** {order_type}\n"
-                     f"**Price:** {'₹' + str(price) if price else 'Market Price'}\n"
-                     f"**Product:** {product}\n"
-                     f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                     f"{order_details_text(tradingsymbol, exchange, transaction_type, quantity, order_type, price, product, timestamp)}"
                      f"⚠️ **DRY RUN MODE ACTIVE** - No actual order placed"
             )]
         
         logger.info(f"Placing live order: {tradingsymbol} {transaction_type} {quantity}")
-        order_id = kite.place_order(**order_params)
+        order_id = await run_kite(place_order, **order_params)
         
         risk_manager.record_order(order_params, order_id, "PLACED")
         
@@ -1084,14 +1352,7 @@ async def place_order_tool(arguments: dict) -> list[types.TextContent]:
             type="text",
             text=f"✅ **Live Order Placed Successfully**\n\n"
                  f"**Order ID:** {order_id}\n"
-                 f"**Symbol:** {tradingsymbol}\n"
-                 f"**Exchange:** {exchange}\n"
-                 f"**Type:** {transaction_type}\n"
-                 f"**Quantity:** {quantity}\n"
-                 f"**Order Type:** {order_type}\n"
-                 f"**Price:** {'₹' + str(price) if price else 'Market Price'}\n"
-                 f"**Product:** {product}\n"
-                 f"**Time:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+                 f"{order_details_text(tradingsymbol, exchange, transaction_type, quantity, order_type, price, product, timestamp)}"
                  f"📊 **Risk Status:**\n"
                  f"- Daily Trades: {risk_status['daily_trades']}/{risk_status['daily_trade_limit']}\n"
                  f"- Daily P&L: ₹{risk_status['daily_pnl']:.2f}\n"
@@ -1115,8 +1376,9 @@ async def get_positions_tool(arguments: dict) -> list[types.TextContent]:
     
     try:
         if position_type == "all":
-            day_positions = kite.positions()['day']
-            net_positions = kite.positions()['net']
+            positions = await run_kite(get_account_data, "positions")
+            day_positions = positions['day']
+            net_positions = positions['net']
             
             result = {
                 'day_positions': day_positions,
@@ -1126,17 +1388,19 @@ async def get_positions_tool(arguments: dict) -> list[types.TextContent]:
                 'timestamp': datetime.now().isoformat()
             }
         else:
-            positions = kite.positions()[position_type]
+            positions = (await run_kite(get_account_data, "positions"))[position_type]
             result = {
                 f'{position_type}_positions': positions,
                 f'total_{position_type}_positions': len(positions),
                 'timestamp': datetime.now().isoformat()
             }
         
+        payload = await dump_json_async(result)
+        
         return [types.TextContent(
             type="text",
             text=f"📊 **Current Positions**\n\n"
-                 f"```json\n{json.dumps(result, indent=2, default=str)}\n```"
+                 f"```json\n{payload}\n```"
         )]
         
     except Exception as e:
@@ -1147,17 +1411,19 @@ async def get_margins_tool(arguments: dict) -> list[types.TextContent]:
     segment = arguments.get("segment", "all")
     
     try:
-        margins = kite.margins()
+        margins = await run_kite(get_account_data, "margins")
         
         if segment == "all":
             result = margins
         else:
             result = margins.get(segment, {})
         
+        payload = await dump_json_async(result)
+        
         return [types.TextContent(
             type="text",
             text=f"💰 **Account Margins**\n\n"
-                 f"```json\n{json.dumps(result, indent=2, default=str)}\n```"
+                 f"```json\n{payload}\n```"
         )]
         
     except Exception as e:
@@ -1168,43 +1434,42 @@ async def get_risk_status_tool(arguments: dict) -> list[types.TextContent]:
     include_history = arguments.get("include_history", False)
     
     try:
-        risk_status = risk_manager.get_risk_status()
+        risk_status = risk_manager.get_risk_status(include_history=include_history)
         
         market_status = "🟢 OPEN" if risk_status['market_open'] else "🔴 CLOSED"
         circuit_status = "🚨 ACTIVE" if risk_status['circuit_breaker_active'] else "✅ NORMAL"
         
-        status_text = f"🛡️ **Risk Management Status**\n\n"
-        
-        status_text += f"**System Status:**\n"
-        status_text += f"- Environment: {config.environment.upper()}\n"
-        status_text += f"- Market: {market_status}\n"
-        status_text += f"- Circuit Breaker: {circuit_status}\n"
-        status_text += f"- Dry Run Mode: {'🧪 ACTIVE' if config.dry_run_mode else '🚀 LIVE TRADING'}\n\n"
-        
-        status_text += f"**Daily Limits:**\n"
-        status_text += f"- Trades: {risk_status['daily_trades']}/{risk_status['daily_trade_limit']} "
-        status_text += f"({risk_status['remaining_trade_buffer']} remaining)\n"
-        status_text += f"- P&L: ₹{risk_status['daily_pnl']:.2f}\n"
-        status_text += f"- Loss Buffer: ₹{risk_status['remaining_loss_buffer']:.2f}\n"
-        status_text += f"- Positions: {risk_status['positions_count']}\n\n"
-        
-        status_text += f"**Risk Configuration:**\n"
-        status_text += f"- Max Daily Loss: ₹{config.risk_limits.max_daily_loss:,.0f}\n"
-        status_text += f"- Max Order Value: ₹{config.risk_limits.max_order_value:,.0f}\n"
-        status_text += f"- Max Orders/Min: {config.risk_limits.max_orders_per_minute}\n"
-        status_text += f"- Order Cooldown: {config.risk_limits.cooldown_between_orders}s\n\n"
-        
         current_time = datetime.now().strftime("%H:%M:%S")
-        status_text += f"**Market Hours:**\n"
-        status_text += f"- Current Time: {current_time}\n"
-        status_text += f"- Regular Hours: {config.market_hours.market_open} - {config.market_hours.market_close}\n"
-        status_text += f"- Extended Hours: {'Enabled' if config.market_hours.allow_extended_hours else 'Disabled'}\n\n"
-        
-        if include_history and risk_manager.trade_history:
-            status_text += f"**Recent Trades (Last 5):**\n"
-            for trade in risk_manager.trade_history[-5:]:
-                status_text += f"- {trade.timestamp.strftime('%H:%M')} {trade.symbol} {trade.transaction_type} {trade.quantity} @ ₹{trade.price}\n"
-            status_text += "\n"
+        parts = [
+            f"🛡️ **Risk Management Status**\n\n"
+            f"**System Status:**\n"
+            f"- Environment: {config.environment.upper()}\n"
+            f"- Market: {market_status}\n"
+            f"- Circuit Breaker: {circuit_status}\n"
+            f"- Dry Run Mode: {'🧪 ACTIVE' if config.dry_run_mode else '🚀 LIVE TRADING'}\n\n"
+            f"**Daily Limits:**\n"
+            f"- Trades: {risk_status['daily_trades']}/{risk_status['daily_trade_limit']} "
+            f"({risk_status['remaining_trade_buffer']} remaining)\n"
+            f"- P&L: ₹{risk_status['daily_pnl']:.2f}\n"
+            f"- Loss Buffer: ₹{risk_status['remaining_loss_buffer']:.2f}\n"
+            f"- Positions: {risk_status['positions_count']}\n\n"
+            f"**Risk Configuration:**\n"
+            f"- Max Daily Loss: ₹{config.risk_limits.max_daily_loss:,.0f}\n"
+            f"- Max Order Value: ₹{config.risk_limits.max_order_value:,.0f}\n"
+            f"- Max Orders/Min: {config.risk_limits.max_orders_per_minute}\n"
+            f"- Order Cooldown: {config.risk_limits.cooldown_between_orders}s\n\n"
+            f"**Market Hours:**\n"
+            f"- Current Time: {current_time}\n"
+            f"- Regular Hours: {config.market_hours.market_open} - {config.market_hours.market_close}\n"
+            f"- Extended Hours: {'Enabled' if config.market_hours.allow_extended_hours else 'Disabled'}\n\n"
+        ]
+        
+        recent_trades = risk_status.get('recent_trades')
+        if recent_trades:
+            parts.append(f"**Recent Trades (Last 5):**\n")
+            for trade in recent_trades:
+                parts.append(f"- {trade.timestamp.strftime('%H:%M')} {trade.symbol} {trade.transaction_type} {trade.quantity} @ ₹{trade.price}\n")
+            parts.append("\n")
         
         warnings = []
         if risk_status['daily_pnl'] < -config.risk_limits.max_daily_loss * 0.8:
@@ -1215,12 +1480,13 @@ async def get_risk_status_tool(arguments: dict) -> list[types.TextContent]:
             warnings.append("⚠️ Market is closed - orders will be rejected")
             
         if warnings:
-            status_text += f"**Warnings:**\n"
+            parts.append(f"**Warnings:**\n")
             for warning in warnings:
-                status_text += f"{warning}\n"
-            status_text += "\n"
+                parts.append(f"{warning}\n")
+            parts.append("\n")
         
-        status_text += f"*Status updated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
+        parts.append(f"*Status updated at {datetime.now().strftime(TIMESTAMP_FORMAT)}*")
+        status_text = "".join(parts)
         
         return [types.TextContent(type="text", text=status_text)]
         
@@ -1236,10 +1502,20 @@ async def set_stop_loss_tool(arguments: dict) -> list[types.TextContent]:
     order_type = arguments.get("order_type", "SL-M")
     
     try:
-        if not kite:
-            init_kite()
+        await ensure_kite()
+        
+        exchange = _exchange_for(tradingsymbol)
+        quote_key = f"{exchange}:{tradingsymbol}"
+        
+        # Positions and the quote are independent - fetch both at once, surface errors in the old order
+        positions, quote = await asyncio.gather(
+            run_kite(get_account_data, "positions"),
+            run_kite(get_quotes, [quote_key]),
+            return_exceptions=True
+        )
+        if isinstance(positions, BaseException):
+            raise positions
         
-        positions = kite.positions()
         current_position = None
         
         for pos in positions['day'] + positions['net']:
@@ -1266,9 +1542,9 @@ async def set_stop_loss_tool(arguments: dict) -> list[types.TextContent]:
             transaction_type = "BUY"
             stop_loss_logic = f"BUY if price rises to ₹{stop_loss_price}"
         
-        exchange = "NFO" if any(x in tradingsymbol for x in ['FUT', 'CE', 'PE']) else "NSE"
-        quote = kite.quote(f"{exchange}:{tradingsymbol}")
-        current_price = quote[f"{exchange}:{tradingsymbol}"]["last_price"]
+        if isinstance(quote, BaseException):
+            raise quote
+        current_price = quote[quote_key]["last_price"]
         
         validation_message = ""
         if position_quantity > 0 and stop_loss_price >= current_price:
@@ -1277,118 +1553,131 @@ async def set_stop_loss_tool(arguments: dict) -> list[types.TextContent]:
             validation_message = "⚠️ Stop loss price should be above current price for short positions"
         
         placed_orders = []
-        
-        try:
-            if any(x in tradingsymbol for x in ['CE', 'PE']):
-                sl_order_params = {
-                    "variety": "regular",
-                    "tradingsymbol": tradingsymbol,
-                    "exchange": exchange,
-                    "transaction_type": transaction_type,
-                    "quantity": quantity,
-                    "order_type": "LIMIT",
-                    "price": stop_loss_price,
-                    "product": current_position.get('product', 'MIS')
-                }
-                stop_loss_logic = f"Manual monitoring required: {transaction_type} at ₹{stop_loss_price} (LIMIT order placed)"
-            else:
-                sl_order_params = {
-                    "variety": "regular",
-                    "tradingsymbol": tradingsymbol,
-                    "exchange": exchange,
-                    "transaction_type": transaction_type,
-                    "quantity": quantity,
-                    "order_type": order_type,
-                    "trigger_price": stop_loss_price,
-                    "product": current_position.get('product', 'MIS')
-                }
-                
-                if order_type == "SL":
-                    sl_order_params["price"] = stop_loss_price * 0.99 if transaction_type == "SELL" else stop_loss_price * 1.01
-            
-            sl_order_id = kite.place_order(**sl_order_params)
-            placed_orders.append({
-                "type": "Stop Loss",
-                "order_id": sl_order_id,
+        product = current_position.get('product', 'MIS')
+        
+        if _OPTION_TAIL.search(tradingsymbol):
+            sl_order_params = {
+                "variety": "regular",
+                "tradingsymbol": tradingsymbol,
+                "exchange": exchange,
+                "transaction_type": transaction_type,
+                "quantity": quantity,
+                "order_type": "LIMIT",
+                "price": stop_loss_price,
+                "product": product
+            }
+            stop_loss_logic = f"Manual monitoring required: {transaction_type} at ₹{stop_loss_price} (LIMIT order placed)"
+        else:
+            sl_order_params = {
+                "variety": "regular",
+                "tradingsymbol": tradingsymbol,
+                "exchange": exchange,
+                "transaction_type": transaction_type,
+                "quantity": quantity,
+                "order_type": order_type,
                 "trigger_price": stop_loss_price,
-                "logic": stop_loss_logic
-            })
+                "product": product
+            }
+            
+            if order_type == "SL":
+                sl_order_params["price"] = stop_loss_price * 0.99 if transaction_type == "SELL" else stop_loss_price * 1.01
+        
+        target_order_params = None
+        if target_price:
+            target_order_params = {
+                "variety": "regular",
+                "tradingsymbol": tradingsymbol,
+                "exchange": exchange,
+                "transaction_type": transaction_type,
+                "quantity": quantity,
+                "order_type": "LIMIT",
+                "price": target_price,
+                "product": product
+            }
+        
+        # The two orders are independent, so place them together instead of back to back
+        placements = [run_kite(place_order, **sl_order_params)]
+        if target_order_params:
+            placements.append(run_kite(place_order, **target_order_params))
+        results = await asyncio.gather(*placements, return_exceptions=True)
+        sl_result = results[0]
+        target_result = results[1] if target_order_params else None
+        
+        if isinstance(sl_result, BaseException):
+            # No target without a stop loss - withdraw a target that went through alongside the failed stop loss
+            cancel_note = ""
+            if target_order_params and not isinstance(target_result, BaseException):
+                try:
+                    await run_kite(kite.cancel_order, variety="regular", order_id=target_result)
+                    cancel_note = f"Target order {target_result} was cancelled.\n"
+                except Exception as cancel_error:
+                    logger.error(f"Failed to cancel target order {target_result} after stop loss failure: {cancel_error}")
+                    cancel_note = f"⚠️ Target order {target_result} is still open - cancel it manually.\n"
             
-        except Exception as e:
             return [types.TextContent(
                 type="text",
                 text=f"❌ **Stop Loss Order Failed**\n\n"
-                     f"**Error:** {str(e)}\n"
+                     f"**Error:** {str(sl_result)}\n"
                      f"**Symbol:** {tradingsymbol}\n"
                      f"**Trigger Price:** ₹{stop_loss_price}\n\n"
+                     f"{cancel_note}"
                      f"{validation_message}"
             )]
         
-        if target_price:
-            try:
-                target_order_params = {
-                    "variety": "regular",
-                    "tradingsymbol": tradingsymbol,
-                    "exchange": exchange,
-                    "transaction_type": transaction_type,
-                    "quantity": quantity,
-                    "order_type": "LIMIT",
-                    "price": target_price,
-                    "product": current_position.get('product', 'MIS')
-                }
-                
-                target_order_id = kite.place_order(**target_order_params)
-                target_logic = f"{transaction_type} if price reaches ₹{target_price}"
+        placed_orders.append({
+            "type": "Stop Loss",
+            "order_id": sl_result,
+            "trigger_price": stop_loss_price,
+            "logic": stop_loss_logic
+        })
+        
+        if target_order_params:
+            if isinstance(target_result, BaseException):
                 placed_orders.append({
                     "type": "Target",
-                    "order_id": target_order_id,
-                    "price": target_price,
-                    "logic": target_logic
+                    "error": str(target_result),
+                    "price": target_price
                 })
-                
-            except Exception as e:
+            else:
                 placed_orders.append({
                     "type": "Target",
-                    "error": str(e),
-                    "price": target_price
+                    "order_id": target_result,
+                    "price": target_price,
+                    "logic": f"{transaction_type} if price reaches ₹{target_price}"
                 })
         
-        response_text = f"✅ **Stop Loss Orders Placed Successfully**\n\n"
-        response_text += f"**Position Details:**\n"
-        response_text += f"- Symbol: {tradingsymbol}\n"
-        response_text += f"- Current Position: {position_quantity} shares\n"
-        response_text += f"- Current Price: ₹{current_price}\n"
-        response_text += f"- Average Price: ₹{current_position.get('average_price', 0)}\n\n"
+        parts = [
+            f"✅ **Stop Loss Orders Placed Successfully**\n\n",
+            f"**Position Details:**\n",
+            f"- Symbol: {tradingsymbol}\n",
+            f"- Current Position: {position_quantity} shares\n",
+            f"- Current Price: ₹{current_price}\n",
+            f"- Average Price: ₹{current_position.get('average_price', 0)}\n\n"
+        ]
         
         if validation_message:
-            response_text += f"**Warning:**\n{validation_message}\n\n"
+            parts.append(f"**Warning:**\n{validation_message}\n\n")
         
-        response_text += f"**Orders Placed:**\n"
+        parts.append(f"**Orders Placed:**\n")
         for order in placed_orders:
             if "error" in order:
-                response_text += f"❌ {order['type']}: Failed - {order['error']}\n"
+                parts.append(f"❌ {order['type']}: Failed - {order['error']}\n")
             else:
-                response_text += f"✅ {order['type']}: Order ID {order['order_id']}\n"
-                response_text += f"   Logic: {order['logic']}\n"
+                parts.append(f"✅ {order['type']}: Order ID {order['order_id']}\n   Logic: {order['logic']}\n")
         
-        response_text += f"\n**Risk Management:**\n"
-        if position_quantity > 0:
-            potential_loss = (current_position.get('average_price', current_price) - stop_loss_price) * quantity
-            response_text += f"- Max Loss Protected: ₹{potential_loss:.2f}\n"
-        else:
-            potential_loss = (stop_loss_price - current_position.get('average_price', current_price)) * quantity  
-            response_text += f"- Max Loss Protected: ₹{potential_loss:.2f}\n"
+        parts.append(f"\n**Risk Management:**\n")
+        average_price = current_position.get('average_price', current_price)
+        direction = 1 if position_quantity > 0 else -1  # long positions lose below average, shorts above
+        potential_loss = direction * (average_price - stop_loss_price) * quantity
+        parts.append(f"- Max Loss Protected: ₹{potential_loss:.2f}\n")
         
         if target_price:
-            if position_quantity > 0:
-                potential_profit = (target_price - current_position.get('average_price', current_price)) * quantity
-            else:
-                potential_profit = (current_position.get('average_price', current_price) - target_price) * quantity
-            response_text += f"- Potential Profit: ₹{potential_profit:.2f}\n"
+            potential_profit = direction * (target_price - average_price) * quantity
+            parts.append(f"- Potential Profit: ₹{potential_profit:.2f}\n")
         
-        response_text += f"\nUse `monitor_stop_orders` to track these orders."
+        parts.append(f"\nUse `monitor_stop_orders` to track these orders.")
         
-        return [types.TextContent(type="text", text=response_text)]
+        return [types.TextContent(type="text", text="".join(parts))]
         
     except Exception as e:
         return [types.TextContent(type="text", text=f"Stop loss setup error: {str(e)}")]
@@ -1398,22 +1687,30 @@ async def monitor_stop_orders_tool(arguments: dict) -> list[types.TextContent]:
     filter_symbol = arguments.get("tradingsymbol")
     
     try:
-        if not kite:
-            init_kite()
+        await ensure_kite()
         
-        all_orders = kite.orders()
+        if filter_symbol:
+            # The quote key is known up front, so the quote rides along with the order book request
+            filter_key = f"{_exchange_for(filter_symbol)}:{filter_symbol}"
+            all_orders, prefetched_quotes = await asyncio.gather(run_kite(kite.orders), fetch_quotes([filter_key]))
+        else:
+            all_orders, prefetched_quotes = await run_kite(kite.orders), None
         
-        stop_orders = []
+        # Filter, group by symbol and tally the summary counts in a single pass over the order book
+        orders_by_symbol = defaultdict(list)
+        sl_count = target_count = 0
         for order in all_orders:
-            if (order['order_type'] in ['SL', 'SL-M'] or 
-                (order['order_type'] == 'LIMIT' and order['status'] in ['OPEN', 'TRIGGER PENDING'])):
-                
-                if filter_symbol and order['tradingsymbol'] != filter_symbol:
-                    continue
-                    
-                stop_orders.append(order)
+            if filter_symbol and order['tradingsymbol'] != filter_symbol:
+                continue
+            if order['order_type'] in _SL_TYPES:
+                sl_count += 1
+            elif order['order_type'] == 'LIMIT' and order['status'] in _PENDING_STATUSES:
+                target_count += 1
+            else:
+                continue
+            orders_by_symbol[order['tradingsymbol']].append(order)
         
-        if not stop_orders:
+        if not orders_by_symbol:
             filter_text = f" for {filter_symbol}" if filter_symbol else ""
             return [types.TextContent(
                 type="text",
@@ -1422,91 +1719,146 @@ async def monitor_stop_orders_tool(arguments: dict) -> list[types.TextContent]:
                      f"Use `set_stop_loss` to protect your positions."
             )]
         
-        orders_by_symbol = {}
-        for order in stop_orders:
-            symbol = order['tradingsymbol']
-            if symbol not in orders_by_symbol:
-                orders_by_symbol[symbol] = []
-            orders_by_symbol[symbol].append(order)
+        # One batched quote request for every symbol instead of a round-trip per symbol
+        quote_keys = {symbol: f"{_exchange_for(symbol)}:{symbol}" for symbol in orders_by_symbol}
+        quotes = prefetched_quotes if prefetched_quotes is not None else await fetch_quotes(list(quote_keys.values()))
         
-        response_text = f"📊 **Active Stop Orders Monitor**\n\n"
-        response_text += f"**Found {len(stop_orders)} active orders across {len(orders_by_symbol)} symbols:**\n\n"
+        # Header, one block per symbol and the summary go out as separate content blocks,
+        # so a large order book never has to be assembled into one string
+        blocks = [types.TextContent(
+            type="text",
+            text=f"📊 **Active Stop Orders Monitor**\n\n"
+                 f"**Found {sl_count + target_count} active orders across {len(orders_by_symbol)} symbols:**\n\n"
+        )]
         
         for symbol, orders in orders_by_symbol.items():
-            response_text += f"**{symbol}:**\n"
+            parts = [f"**{symbol}:**\n"]
             
-            try:
-                exchange = "NFO" if any(x in symbol for x in ['FUT', 'CE', 'PE']) else "NSE"
-                quote = kite.quote(f"{exchange}:{symbol}")
-                current_price = quote[f"{exchange}:{symbol}"]["last_price"]
-                response_text += f"- Current Price: ₹{current_price}\n"
-            except:
+            quote = quotes.get(quote_keys[symbol])
+            if quote is not None and "last_price" in quote:
+                current_price = quote["last_price"]
+                parts.append(f"- Current Price: ₹{current_price}\n")
+            else:
                 current_price = 0
-                response_text += f"- Current Price: Unable to fetch\n"
+                parts.append(f"- Current Price: Unable to fetch\n")
             
             for order in orders:
-                order_type_desc = "🛡️ Stop Loss" if order['order_type'] in ['SL', 'SL-M'] else "🎯 Target"
-                status_icon = "🟢" if order['status'] == 'OPEN' else "🟡" if order['status'] == 'TRIGGER PENDING' else "🔴"
+                status = order['status']
+                trigger_price = order.get('trigger_price')
+                limit_price = order.get('price')
+                is_stop_loss = order['order_type'] in _SL_TYPES
+                order_type_desc = "🛡️ Stop Loss" if is_stop_loss else "🎯 Target"
+                status_icon = _STATUS_ICONS.get(status, "🔴")
                 
-                response_text += f"  {order_type_desc} {status_icon}\n"
-                response_text += f"    Order ID: {order['order_id']}\n"
-                response_text += f"    Type: {order['transaction_type']} {order['quantity']}\n"
-                response_text += f"    Status: {order['status']}\n"
+                parts.extend((
+                    f"  {order_type_desc} {status_icon}\n",
+                    f"    Order ID: {order['order_id']}\n",
+                    f"    Type: {order['transaction_type']} {order['quantity']}\n",
+                    f"    Status: {status}\n"
+                ))
                 
-                if order['order_type'] in ['SL', 'SL-M']:
-                    response_text += f"    Trigger: ₹{order.get('trigger_price', 'N/A')}\n"
-                    if current_price and order.get('trigger_price'):
-                        distance = abs(current_price - order['trigger_price'])
-                        response_text += f"    Distance: ₹{distance:.2f}\n"
+                if is_stop_loss:
+                    parts.append(f"    Trigger: ₹{order.get('trigger_price', 'N/A')}\n")
+                    if current_price and trigger_price:
+                        parts.append(f"    Distance: ₹{abs(current_price - trigger_price):.2f}\n")
                 else:
-                    response_text += f"    Target: ₹{order.get('price', 'N/A')}\n"
-                    if current_price and order.get('price'):
-                        distance = abs(current_price - order['price'])
-                        response_text += f"    Distance: ₹{distance:.2f}\n"
+                    parts.append(f"    Target: ₹{order.get('price', 'N/A')}\n")
+                    if current_price and limit_price:
+                        parts.append(f"    Distance: ₹{abs(current_price - limit_price):.2f}\n")
                 
-                response_text += f"    Time: {order['order_timestamp']}\n"
-                response_text += "\n"
+                parts.append(f"    Time: {order['order_timestamp']}\n\n")
             
-            response_text += "\n"
+            parts.append("\n")
+            blocks.append(types.TextContent(type="text", text="".join(parts)))
         
-        sl_orders = [o for o in stop_orders if o['order_type'] in ['SL', 'SL-M']]
-        target_orders = [o for o in stop_orders if o['order_type'] == 'LIMIT']
-        
-        response_text += f"**Summary:**\n"
-        response_text += f"- Stop Loss Orders: {len(sl_orders)}\n"
-        response_text += f"- Target Orders: {len(target_orders)}\n"
-        response_text += f"- Total Protected Positions: {len(orders_by_symbol)}\n\n"
-        
-        response_text += f"*Monitor updated at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*"
+        blocks.append(types.TextContent(
+            type="text",
+            text=f"**Summary:**\n"
+                 f"- Stop Loss Orders: {sl_count}\n"
+                 f"- Target Orders: {target_count}\n"
+                 f"- Total Protected Positions: {len(orders_by_symbol)}\n\n"
+                 f"*Monitor updated at {datetime.now().strftime(TIMESTAMP_FORMAT)}*"
+        ))
         
-        return [types.TextContent(type="text", text=response_text)]
+        return blocks
         
     except Exception as e:
         return [types.TextContent(type="text", text=f"Stop orders monitor error: {str(e)}")]
 
-async def main():
-    """Main function to run the server"""
+def _legacy_order_handler(transaction_type: str):
+    """Adapt legacy buy_stock/sell_stock arguments to the unified place_order tool"""
+    async def handler(arguments: dict) -> list[types.TextContent]:
+        """Place a legacy directional order"""
+        args = arguments.copy()
+        args["tradingsymbol"] = args.pop("symbol", "")
+        args["transaction_type"] = transaction_type
+        return await place_order_tool(args)
+    return handler
+
+_TOOL_TABLE = {
+    "get_market_data": get_market_data_tool,
+    "get_fno_data": get_fno_data_tool,
+    "get_options_chain": get_options_chain_tool,
+    "calculate_technical_indicators": calculate_technical_indicators_tool,
+    "monitor_orders": monitor_orders_tool,
+    "place_order": place_order_tool,
+    "get_positions": get_positions_tool,
+    "get_margins": get_margins_tool,
+    "get_risk_status": get_risk_status_tool,
+    "set_stop_loss": set_stop_loss_tool,
+    "monitor_stop_orders": monitor_stop_orders_tool,
+    # Legacy aliases
+    "fetch_data": get_market_data_tool,
+    "analyze_data": analyze_data_tool,
+    "buy_stock": _legacy_order_handler("BUY"),
+    "sell_stock": _legacy_order_handler("SELL"),
+}
+
+async def warm_start():
+    """Connect to Kite and prime the caches in the background while the MCP handshake proceeds"""
     try:
-        init_kite()
+        await ensure_kite()
     except Exception as e:
+        # Tools retry the lazy init on their first call and report the failure there
         logger.error(f"Failed to initialize Kite Connect: {e}")
         return
     
+    # Instrument dumps download alongside the session warm-up; lookups that arrive first
+    # simply wait on the same per-exchange lock
+    prefetch = asyncio.gather(*(run_kite(warm_instrument_cache, exchange) for exchange in ("NSE", "NFO")))
+    
+    # Open extra pooled keep-alive connections before the first tool call arrives
+    try:
+        await asyncio.gather(run_kite(kite.margins), run_kite(kite.positions))
+    except Exception as e:
+        logger.warning(f"Kite session warm-up failed: {e}")
+    
+    await prefetch
+
+async def main():
+    """Main function to run the server"""
+    # Kite auth is a network round-trip - run it behind the handshake instead of in front of it
+    startup_task = asyncio.create_task(warm_start())
+    
     from mcp.server.stdio import stdio_server
     
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="zerodha-kite-mcp",
-                server_version="1.0.0",
-                capabilities=app.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await app.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="zerodha-kite-mcp",
+                    server_version="1.0.0",
+                    capabilities=app.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        # A client that disconnects during start-up must not leave the warm-up pending at loop shutdown
+        startup_task.cancel()
 
 if __name__ == "__main__":
     asyncio.run(main())
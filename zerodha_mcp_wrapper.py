@@ -5,7 +5,6 @@ This ensures the server can be found by Cursor
 
 import os
 import sys
-import subprocess
 
 ZERODHA_DIR = os.path.dirname(os.path.abspath(__file__))
 PYTHON_PATH = os.path.join(ZERODHA_DIR, "zerodha_mcp_env", "bin", "python")
@@ -20,16 +19,19 @@ def main():
     env['VIRTUAL_ENV'] = f"{ZERODHA_DIR}/zerodha_mcp_env"
     env['PATH'] = f"{ZERODHA_DIR}/zerodha_mcp_env/bin:" + env.get('PATH', '')
     
+    for path in (PYTHON_PATH, SERVER_SCRIPT):
+        if not os.path.exists(path):
+            print(f"File not found: {path}", file=sys.stderr)
+            print(f"Python path: {PYTHON_PATH}", file=sys.stderr)
+            print(f"Server script: {SERVER_SCRIPT}", file=sys.stderr)
+            sys.exit(1)
+    
+    # Replace this process with the server - same PID and stdio pipes, no idle parent left behind
     try:
-        subprocess.run([PYTHON_PATH, SERVER_SCRIPT], env=env, check=True)
-    except subprocess.CalledProcessError as e:
+        os.execve(PYTHON_PATH, [PYTHON_PATH, SERVER_SCRIPT], env)
+    except OSError as e:
         print(f"Error running server: {e}", file=sys.stderr)
         sys.exit(1)
-    except FileNotFoundError as e:
-        print(f"File not found: {e}", file=sys.stderr)
-        print(f"Python path: {PYTHON_PATH}", file=sys.stderr)
-        print(f"Server script: {SERVER_SCRIPT}", file=sys.stderr)
-        sys.exit(1)
 
 if __name__ == "__main__":
     main()